@@ -2,7 +2,10 @@ import time
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from ..core.environment import MazeEnvironment
+from ..core.history import ExplorationHistory
 from ..core.results import SearchResult
 from typing import Tuple, Optional
 
@@ -20,14 +23,22 @@ class SearchAlgorithmBase(ABC):
     def _reconstruct_path(self, parent, start, goal):
         """Reconstruct the solution path from parent pointers."""
         path = [goal]
+        append = path.append
         current = goal
         while current != start:
             current = parent[current]
-            path.append(current)
-        return path[::-1]  # Reverse to get start→goal
+            append(current)
+        path.reverse()  # In place, to get start→goal without copying
+        return path
 
     def create_search_result(self, path, visited_order, success, steps, exploration_history, **kwargs):
-        """Create a standardized SearchResult with support for additional metrics."""
+        """Create a standardized SearchResult with support for additional metrics.
+
+        Additional metrics are set by name, so each must be a SearchResult field.
+        The search is over, so a spooled exploration history is closed.
+        """
+        if isinstance(exploration_history, ExplorationHistory):
+            exploration_history.close()
         result = SearchResult(
             path=path,
             visited=visited_order,
@@ -40,6 +51,51 @@ class SearchAlgorithmBase(ABC):
             setattr(result, key, value)
         return result
 
+    def _create_packed_result(self, path, success, steps, node_discovery, node_expansion,
+                              exploration_history=None):
+        """Create a SearchResult from a fast search run over packed node ids.
+
+        The fast searches key their state by ``env.pack`` ids; this converts
+        the path and discovery/expansion steps back to (row, col). Nodes are
+        discovered exactly once, in visit order, so node_discovery's insertion
+        order doubles as the visit order.
+        """
+        coords = self.env.coords
+        return self.create_search_result(
+            path=[coords[idx] for idx in path] if path is not None else None,
+            visited_order=[coords[idx] for idx in node_discovery],
+            success=success,
+            steps=steps,
+            exploration_history=exploration_history if exploration_history is not None else [],
+            node_discovery={coords[idx]: step for idx, step in node_discovery.items()},
+            node_expansion={coords[idx]: step for idx, step in node_expansion.items()}
+        )
+
+    def _create_kernel_result(self, path_ids, visited_ids, steps, discovery, expansion):
+        """Create a SearchResult from the output of a compiled Numba search kernel.
+
+        Kernels return the path and visit order as arrays of packed ids and
+        the discovery/expansion steps as per-cell arrays, -1 where a cell was
+        never discovered/expanded. The node dicts are read off those arrays
+        with one array lookup each rather than per-node scalar indexing.
+        """
+        coords = self.env.coords
+        visited_ids = visited_ids.tolist()
+        visited = [coords[idx] for idx in visited_ids]
+        # Each expanded cell has its own step, so sorting by step gives the expansion order
+        expanded_ids = np.flatnonzero(expansion >= 0)
+        expanded_ids = expanded_ids[np.argsort(expansion[expanded_ids], kind="stable")]
+        return self.create_search_result(
+            path=[coords[idx] for idx in path_ids.tolist()] if len(path_ids) else None,
+            visited_order=visited,
+            success=len(path_ids) > 0,
+            steps=int(steps),
+            exploration_history=[],
+            node_discovery=dict(zip(visited, discovery[visited_ids].tolist())),
+            node_expansion=dict(zip([coords[idx] for idx in expanded_ids.tolist()],
+                                    expansion[expanded_ids].tolist()))
+        )
+
     @abstractmethod
     def search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
         """Search for a path from start to goal."""
@@ -52,14 +108,14 @@ class SearchAlgorithmBase(ABC):
         start = start if start is not None else self.env.start
         goal = goal if goal is not None else self.env.end
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = self.search(start, goal)
         except Exception as e:
             print(f"Error in {self.name}: {str(e)}")
             result = SearchResult(success=False)
 
-        result.execution_time = time.time() - start_time
+        result.execution_time = time.perf_counter() - start_time
         return result
 
     @abstractmethod
@@ -0,0 +1,196 @@
+import numpy as np
+
+from ...core._numba import njit
+
+# Neighbor offsets in the same order as MazeEnvironment._create_graph: up, right, down, left
+_DY = (-1, 0, 1, 0)
+_DX = (0, 1, 0, -1)
+
+
+@njit(cache=True)
+def _heap_less(heap_f, heap_g, heap_seq, a, b):
+    """Heap ordering: lowest f, then highest g, then earliest insertion."""
+    if heap_f[a] != heap_f[b]:
+        return heap_f[a] < heap_f[b]
+    if heap_g[a] != heap_g[b]:
+        return heap_g[a] > heap_g[b]
+    return heap_seq[a] < heap_seq[b]
+
+
+@njit(cache=True)
+def _heap_swap(heap_f, heap_g, heap_seq, heap_node, a, b):
+    heap_f[a], heap_f[b] = heap_f[b], heap_f[a]
+    heap_g[a], heap_g[b] = heap_g[b], heap_g[a]
+    heap_seq[a], heap_seq[b] = heap_seq[b], heap_seq[a]
+    heap_node[a], heap_node[b] = heap_node[b], heap_node[a]
+
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_g, heap_seq, heap_node, size, f, g, seq, node):
+    """Append an entry and sift it up; returns the new heap size."""
+    i = size
+    heap_f[i] = f
+    heap_g[i] = g
+    heap_seq[i] = seq
+    heap_node[i] = node
+    while i > 0:
+        up = (i - 1) >> 1
+        if not _heap_less(heap_f, heap_g, heap_seq, i, up):
+            break
+        _heap_swap(heap_f, heap_g, heap_seq, heap_node, i, up)
+        i = up
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_g, heap_seq, heap_node, size):
+    """Move the root entry to index ``size - 1`` and sift down the rest; returns the new size."""
+    size -= 1
+    _heap_swap(heap_f, heap_g, heap_seq, heap_node, 0, size)
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and _heap_less(heap_f, heap_g, heap_seq, child + 1, child):
+            child += 1
+        if not _heap_less(heap_f, heap_g, heap_seq, child, i):
+            break
+        _heap_swap(heap_f, heap_g, heap_seq, heap_node, i, child)
+        i = child
+    return size
+
+
+@njit(cache=True, nogil=True)
+def astar_grid(grid, sy, sx, gy, gx, max_steps):
+    """A* over a 4-connected, uniform-cost grid (0=path, 1=wall) with Manhattan distance.
+
+    Cells are indexed as ``y * width + x``. Expansion order matches
+    AStarSearch.search: lowest f first, ties broken by higher g and then by
+    insertion order. A negative ``max_steps`` means no step limit. Runs without
+    the GIL, so searches on separate threads run in parallel.
+
+    Returns:
+        (path, visited, steps, discovery, expansion): the cell ids from start
+        to goal (empty if no path was found), the cell ids in discovery order,
+        the number of expansions, and per-cell discovery/expansion steps
+        (-1 where a cell was never discovered/expanded).
+    """
+    height, width = grid.shape
+    n = height * width
+    start = sy * width + sx
+    goal = gy * width + gx
+
+    g = np.full(n, -1, np.int64)
+    frontier_f = np.full(n, -1, np.int64)  # Live f-value per cell, -1 if not in the frontier
+    parent = np.full(n, -1, np.int64)
+    closed = np.zeros(n, np.bool_)
+    discovery = np.full(n, -1, np.int32)
+    expansion = np.full(n, -1, np.int32)
+    visited = np.empty(n, np.int64)
+
+    # Every push follows an edge relaxation, so 4 pushes per cell bound the heap
+    capacity = 4 * n + 1
+    heap_f = np.empty(capacity, np.int64)
+    heap_g = np.empty(capacity, np.int64)
+    heap_seq = np.empty(capacity, np.int64)
+    heap_node = np.empty(capacity, np.int64)
+
+    h_start = abs(sy - gy) + abs(sx - gx)
+    g[start] = 0
+    frontier_f[start] = h_start
+    discovery[start] = 0
+    visited[0] = start
+    visited_len = 1
+    size = _heap_push(heap_f, heap_g, heap_seq, heap_node, 0, h_start, 0, 0, start)
+    seq = 1
+
+    steps = 0
+    found = False
+    while size > 0 and (max_steps < 0 or steps < max_steps):
+        size = _heap_pop(heap_f, heap_g, heap_seq, heap_node, size)
+        current = heap_node[size]
+        f = heap_f[size]
+
+        # Skip stale entries (lazy deletion)
+        if closed[current] or frontier_f[current] != f:
+            continue
+
+        steps += 1
+        frontier_f[current] = -1
+        closed[current] = True
+        expansion[current] = steps
+
+        if current == goal:
+            found = True
+            break
+
+        cy = current // width
+        cx = current - cy * width
+        for k in range(4):
+            ny = cy + _DY[k]
+            nx = cx + _DX[k]
+            if ny < 0 or ny >= height or nx < 0 or nx >= width or grid[ny, nx] == 1:
+                continue
+            neighbor = ny * width + nx
+            if closed[neighbor]:
+                continue
+
+            tentative_g = g[current] + 1
+            if frontier_f[neighbor] < 0 or tentative_g < g[neighbor]:
+                parent[neighbor] = current
+                g[neighbor] = tentative_g
+                f_new = tentative_g + abs(ny - gy) + abs(nx - gx)
+
+                if discovery[neighbor] < 0:
+                    discovery[neighbor] = steps
+                    visited[visited_len] = neighbor
+                    visited_len += 1
+
+                # Goal test on generation, as in AStarSearch._search_fast
+                if neighbor == goal and f_new == f and (max_steps < 0 or steps < max_steps):
+                    found = True
+                    continue
+
+                size = _heap_push(heap_f, heap_g, heap_seq, heap_node, size,
+                                  f_new, tentative_g, seq, neighbor)
+                seq += 1
+                frontier_f[neighbor] = f_new
+
+        if found:
+            steps += 1
+            expansion[goal] = steps
+            break
+
+    if not found:
+        return np.empty(0, np.int64), visited[:visited_len], steps, discovery, expansion
+
+    length = 1
+    node = goal
+    while node != start:
+        node = parent[node]
+        length += 1
+    path = np.empty(length, np.int64)
+    node = goal
+    for i in range(length - 1, -1, -1):
+        path[i] = node
+        node = parent[node]
+    return path, visited[:visited_len], steps, discovery, expansion
+
+
+_warmed_up = False
+
+
+def warmup():
+    """Compile astar_grid (or load it from Numba's cache) by running it on a tiny grid.
+
+    Called ahead of the first search so its JIT latency is not part of a
+    timed run. Later calls do nothing.
+    """
+    global _warmed_up
+    if not _warmed_up:
+        # Environment grids are read-only, which Numba compiles as a distinct array type
+        grid = np.zeros((3, 3), np.int8)
+        grid.setflags(write=False)
+        astar_grid(grid, 1, 1, 1, 1, -1)
+        _warmed_up = True
@@ -1,8 +1,14 @@
+import sys
+from functools import partial
+from itertools import count
 from typing import Tuple
-from IPython.display import clear_output
-from matplotlib import pyplot as plt
+import numpy as np
 
 from .base import InformedSearch
+from .priority_queues import BucketQueue, HeapQueue
+from ._astar_numba import astar_grid, warmup
+from ...core._numba import NUMBA_AVAILABLE
+from ...core.history import ExplorationHistory
 from ...core.results import SearchResult
 
 
@@ -14,18 +20,14 @@ class AStarSearch(InformedSearch):
     and is guaranteed to find the optimal path if the heuristic is admissible.
     """
 
-    def _reconstruct_path(self, parent, start, goal):
-        """Reconstruct the solution path from parent pointers."""
-        # Same as in previous implementations
-        path = [goal]
-        current = goal
-        while current != start:
-            current = parent[current]
-            path.append(current)
-        return path[::-1]
-
-    def search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
-        """Perform A* Search from start to goal."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Compile the Numba kernel up front so run() doesn't time JIT compilation
+        if NUMBA_AVAILABLE and not self.config.show_exploration:
+            warmup()
+
+    def _search_traced(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Perform A* Search from start to goal, recording educational metrics."""
         # Initialize metrics using base class method
         metrics = self._initialize_metrics(start, goal)
 
@@ -36,28 +38,46 @@ class AStarSearch(InformedSearch):
         node_g_value = metrics["node_g_value"]
         node_f_value = metrics["node_f_value"]
 
-        # Priority queue (list that we'll sort)
-        # Each entry is (f_value, g_value, node) - f = g + h
-        frontier = [(node_f_value[start], 0, start)]  # f=h+g, g=0 for start node
-        frontier_dict = {start: node_f_value[start]}  # Maps node -> f_value
+        # Priority queue (bucket queue or binary heap, see _create_frontier)
+        # Each entry is (f_value, -g_value, insertion_order, node) - f = g + h, ties
+        # prefer the higher g and then the earlier insertion
+        counter = count()
+        frontier = self._create_frontier(start)
+        frontier.push((node_f_value[start], 0, next(counter), start))  # f=h+g, g=0 for start node
+        frontier_dict = {start: node_f_value[start]}  # Maps node -> live f_value
 
         # Tracking variables
         closed_set = set()  # Nodes already expanded
-        visited_order = [start]
         parent = {start: None}
         g_value = {start: 0}  # Cost from start to node
 
-        exploration_history = []
+        # Frontier changes are recorded as (f, g, node) entries
+        exploration_history = ExplorationHistory(
+            partial(self._reconstruct_path, parent, start),
+            initial_frontier=[(node_f_value[start], 0, start)],
+            sort_key=self._display_order,
+            sink=self.config.exploration_sink
+        )
+
+        # Bind attribute lookups once instead of on every iteration
+        graph_get = self.env.graph.get
+        step_cost = self.env.get_step_cost
+        manhattan = self.env.calculate_manhattan_distance
+        push = frontier.push
+        pop = frontier.pop
 
         steps = 0
-        max_steps = self.config.max_steps or float('inf')
+        max_steps = self.config.max_steps or sys.maxsize
 
         while frontier and steps < max_steps:
-            steps += 1
+            f, _, _, current_node = pop()
+
+            # Skip entries superseded by a cheaper path (lazy deletion); an old
+            # entry can also resurface after its node has already been expanded
+            if current_node in closed_set or frontier_dict.get(current_node) != f:
+                continue
 
-            # Sort by f_value (and break ties with g_value)
-            frontier.sort(key=lambda x: (x[0], -x[1]))  # Sort by f, then by -g (prefer higher g if same f)
-            f, g, current_node = frontier.pop(0)
+            steps += 1
             del frontier_dict[current_node]
 
             # Add to closed set
@@ -71,7 +91,7 @@ class AStarSearch(InformedSearch):
                 # Use create_search_result to include all metrics
                 return self.create_search_result(
                     path=final_path,
-                    visited_order=visited_order,
+                    visited_order=list(node_discovery),
                     success=True,
                     steps=steps,
                     exploration_history=exploration_history,
@@ -84,65 +104,51 @@ class AStarSearch(InformedSearch):
 
             # Process neighbors
             neighbors_added = []
-            frontier_before = frontier.copy() if self.config.show_exploration else None
+            frontier_removed = [(f, g_value[current_node], current_node)]
 
-            for neighbor in self.env.graph.get(current_node, []):
+            for neighbor in graph_get(current_node, []):
                 if neighbor in closed_set:
                     continue
 
                 # Calculate new g-value
-                tentative_g = g_value[current_node] + self.env.get_step_cost(current_node, neighbor)
+                tentative_g = g_value[current_node] + step_cost(current_node, neighbor)
 
                 # If this node is new OR we found a better path to it
                 if self._should_update_node(neighbor, tentative_g, g_value, frontier_dict):
+                    if neighbor in frontier_dict:
+                        # The old entry is superseded by the cheaper path
+                        frontier_removed.append((frontier_dict[neighbor], g_value[neighbor], neighbor))
+
                     # Update tracking info
                     parent[neighbor] = current_node
                     g_value[neighbor] = tentative_g
 
                     # Calculate f-value
-                    h = self.env.calculate_manhattan_distance(neighbor, goal)
+                    h = manhattan(neighbor, goal)
                     f = self._calculate_f(tentative_g, h)
 
                     # Add to educational tracking
                     if neighbor not in node_discovery:
                         node_discovery[neighbor] = steps
-                        visited_order.append(neighbor)
 
                     node_h_value[neighbor] = h
                     node_g_value[neighbor] = tentative_g
                     node_f_value[neighbor] = f
 
-                    # Update frontier
-                    if neighbor in frontier_dict:
-                        # Remove old entry
-                        frontier = [(f_val, g_val, n) for f_val, g_val, n in frontier if n != neighbor]
-
-                    frontier.append((f, tentative_g, neighbor))
+                    # Update frontier (any older entry for this node becomes stale)
+                    push((f, -tentative_g, next(counter), neighbor))
                     frontier_dict[neighbor] = f
                     neighbors_added.append((f, tentative_g, neighbor))
 
-            # Record exploration history
-            if self.config.show_exploration:
-                current_partial_path = self._reconstruct_path(parent, start, current_node) if current_node != start else [start]
-
-                # Use _create_step_info from base class
-                step_info = self._create_step_info(
-                    current_node, steps, neighbors_added,
-                    frontier_before, frontier.copy(),
-                    metrics
-                )
-
-                exploration_history.append((
-                    closed_set.copy(),
-                    frontier.copy(),
-                    current_partial_path,
-                    step_info
-                ))
+            # Record exploration history (paths are rebuilt from parent when replayed)
+            # Use _create_step_info from base class
+            step_info = self._create_step_info(current_node, steps, neighbors_added, metrics)
+            exploration_history.record(current_node, neighbors_added, frontier_removed, step_info)
 
         # No path found - use create_search_result to include all metrics
         return self.create_search_result(
             path=None,
-            visited_order=visited_order,
+            visited_order=list(node_discovery),
             success=False,
             steps=steps,
             exploration_history=exploration_history,
@@ -153,8 +159,118 @@ class AStarSearch(InformedSearch):
             node_f_value=node_f_value
         )
 
+    def _search_fast(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Perform A* Search from start to goal without educational tracking.
+
+        Uses the compiled Numba kernel when Numba is installed and every step
+        costs 1. Otherwise runs the same search as _search_traced over packed
+        node ids, keeping only the state needed for the path and the result
+        summary.
+        """
+        if NUMBA_AVAILABLE and self.env.unit_step_costs:
+            return self._search_compiled(start, goal)
+
+        env = self.env
+        edges = env.edges
+        h_table = env.manhattan_table(goal)
+        start_id = env.pack(start)
+        goal_id = env.pack(goal)
+        h_start = h_table[start_id]
+
+        # Same (f_value, -g_value, insertion_order, node) entries as _search_traced,
+        # with nodes as packed ids
+        counter = count()
+        frontier = self._create_frontier(start)
+        frontier.push((h_start, 0, next(counter), start_id))
+
+        # Per-node state in lists preallocated over all packed ids
+        unreached = float('inf')
+        frontier_f = [None] * len(edges)  # Live f-value, None if not in the frontier
+        frontier_f[start_id] = h_start
+        g_value = [unreached] * len(edges)
+        g_value[start_id] = 0
+        closed = bytearray(len(edges))  # Bitmap of expanded nodes
+        parent = [None] * len(edges)
+        node_discovery = {start_id: 0}
+        node_expansion = {}
+
+        push = frontier.push
+        pop = frontier.pop
+
+        steps = 0
+        max_steps = self.config.max_steps or sys.maxsize
+        found = False
+
+        while frontier and steps < max_steps:
+            f, _, _, current_node = pop()
+
+            # Skip stale entries (lazy deletion)
+            if closed[current_node] or frontier_f[current_node] != f:
+                continue
+
+            steps += 1
+            frontier_f[current_node] = None
+            closed[current_node] = 1
+            node_expansion[current_node] = steps
+
+            if current_node == goal_id:
+                found = True
+                break
+
+            current_g = g_value[current_node]
+            for neighbor, step_cost in edges[current_node]:
+                if closed[neighbor]:
+                    continue
+
+                tentative_g = current_g + step_cost
+                old_g = g_value[neighbor]
+
+                # New node (g still unreached), or a better path to a node in the
+                # frontier; nodes only leave the frontier by being closed
+                if tentative_g < old_g:
+                    parent[neighbor] = current_node
+                    g_value[neighbor] = tentative_g
+                    neighbor_f = tentative_g + h_table[neighbor]
+
+                    if old_g == unreached:
+                        node_discovery[neighbor] = steps
+
+                    # Goal test on generation: with the f just expanded and h = 0
+                    # (the highest g that f allows), the goal would be the very
+                    # next pop, so it is not queued; its expansion is counted once
+                    # the rest of this node's neighbors have been discovered
+                    if neighbor == goal_id and neighbor_f == f and steps < max_steps:
+                        found = True
+                        continue
+
+                    push((neighbor_f, -tentative_g, next(counter), neighbor))
+                    frontier_f[neighbor] = neighbor_f
+
+            if found:
+                steps += 1
+                node_expansion[goal_id] = steps
+                break
+
+        return self._create_packed_result(
+            path=self._reconstruct_path(parent, start_id, goal_id) if found else None,
+            success=found,
+            steps=steps,
+            node_discovery=node_discovery,
+            node_expansion=node_expansion
+        )
+
+    def _search_compiled(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Run the Numba A* kernel on the maze grid and convert its output to a SearchResult."""
+        grid = np.ascontiguousarray(self.env.grid, dtype=np.int8)
+        return self._create_kernel_result(*astar_grid(
+            grid, start[0], start[1], goal[0], goal[1], self.config.max_steps or -1))
+
     def visualize_search(self, result: SearchResult, delay: float = None) -> None:
         """Visualize A* Search with educational information about f, g, h values."""
+        # Imported here so headless searches never load matplotlib or IPython
+        import matplotlib.pyplot as plt
+        from IPython.display import clear_output
+
         if not result.exploration_history:
             print(f"No exploration history available for {self.name}")
             return
@@ -225,10 +341,25 @@ class AStarSearch(InformedSearch):
         print(result)
 
     # Add these missing abstract method implementations
+    def _create_frontier(self, start):
+        """Use a bucket queue when step costs are integers, otherwise a binary heap.
+
+        Manhattan distances are integers, so integer step costs keep every
+        f-value a small integer. The environment checks every edge's cost type
+        when it builds the graph.
+        """
+        if self.env.integer_step_costs:
+            return BucketQueue()
+        return HeapQueue()
+
     def _calculate_f(self, g, h):
         """Calculate f-value using g + h formula for A* search."""
         return g + h
 
+    def _display_order(self, entry):
+        """Order (f, g, node) frontier entries by f, preferring the higher g on ties."""
+        return entry[0], -entry[1]
+
     def _should_update_node(self, neighbor, tentative_g, g_value, frontier_dict):
         """Determine if a node should be updated based on A* criteria.
 
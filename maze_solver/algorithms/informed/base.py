@@ -1,13 +1,34 @@
 from abc import abstractmethod
+from typing import Tuple
 
 from ..base import SearchAlgorithmBase
+from ...core.results import SearchResult
 
 class InformedSearch(SearchAlgorithmBase):
     """Base class for informed search algorithms (Greedy Best-First, A*).
 
     Informed search algorithms use domain knowledge (heuristics) to guide the search.
+    Subclasses provide two implementations of the same search: a traced one that
+    records educational metrics and exploration history for visualization, and a
+    fast one that only keeps the state needed to find the path.
     """
 
+    def search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Run the traced search when exploring is visualized, otherwise the fast one."""
+        if self.config.show_exploration:
+            return self._search_traced(start, goal)
+        return self._search_fast(start, goal)
+
+    @abstractmethod
+    def _search_traced(self, start, goal):
+        """Search while recording per-node metrics and exploration history."""
+        pass
+
+    @abstractmethod
+    def _search_fast(self, start, goal):
+        """Search keeping only the state needed for the path and result summary."""
+        pass
+
     def _initialize_metrics(self, start, goal):
         """Initialize common metrics for informed search algorithms."""
         h_start = self.env.calculate_manhattan_distance(start, goal)
@@ -20,6 +41,11 @@ class InformedSearch(SearchAlgorithmBase):
             "node_f_value": {start: self._calculate_f(0, h_start)}
         }
 
+    @abstractmethod
+    def _create_frontier(self, start):
+        """Create the priority queue used as the frontier (varies by algorithm)."""
+        pass
+
     @abstractmethod
     def _calculate_f(self, g, h):
         """Calculate f-value based on g and h (varies by algorithm)."""
@@ -30,16 +56,22 @@ class InformedSearch(SearchAlgorithmBase):
         """Determine if a node's path should be updated."""
         pass
 
-    def _create_step_info(self, current_node, steps, neighbors_added, frontier_before,
-                          frontier_after, metrics):
-        """Create step info dictionary for informed search visualization."""
+    @abstractmethod
+    def _display_order(self, entry):
+        """Sort key ordering displayed frontier entries by expansion priority."""
+        pass
+
+    def _create_step_info(self, current_node, steps, neighbors_added, metrics):
+        """Create step info dictionary for informed search visualization.
+
+        Frontier snapshots (``frontier_before``/``frontier_after``) are added
+        when the exploration history is replayed.
+        """
         return {
             "step": steps,
             "expanded_node": current_node,
             "expanded_node_f": metrics["node_f_value"][current_node],
             "expanded_node_g": metrics["node_g_value"][current_node],
             "expanded_node_h": metrics["node_h_value"][current_node],
-            "neighbors_added": neighbors_added,
-            "frontier_before": frontier_before,
-            "frontier_after": frontier_after
+            "neighbors_added": neighbors_added
         }
\ No newline at end of file
@@ -1,13 +1,20 @@
+import sys
+from functools import partial
+from itertools import count
 from typing import Tuple
-from IPython.display import clear_output
-from matplotlib import pyplot as plt
 
 from .base import InformedSearch
+from .priority_queues import BucketQueue
+from ...core.history import ExplorationHistory
 from ...core.results import SearchResult
 
 class GreedyBestFirstSearch(InformedSearch):
     """Greedy Best-First Search implementation."""
 
+    def _create_frontier(self, start):
+        """Manhattan distances are small integers, so a bucket queue keyed on h suffices."""
+        return BucketQueue()
+
     def _calculate_f(self, g, h):
         """For Greedy Best-First Search, f = h."""
         return h
@@ -16,34 +23,54 @@ class GreedyBestFirstSearch(InformedSearch):
         """Update if node is not in frontier."""
         return neighbor not in frontier_dict
 
-    def search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
-        """Perform Greedy Best-First Search."""
+    def _display_order(self, entry):
+        """Order (h, node) frontier entries by h."""
+        return entry[0]
+
+    def _search_traced(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Perform Greedy Best-First Search, recording educational metrics."""
         # Initialize metrics
         metrics = self._initialize_metrics(start, goal)
 
-        # Initialize priority queue (using list with sorting)
-        frontier = [(metrics["node_h_value"][start], start)]  # (f=h, node)
+        # Initialize priority queue of (f=h, insertion_order, node) entries
+        counter = count()
+        frontier = self._create_frontier(start)
+        frontier.push((metrics["node_h_value"][start], next(counter), start))
         frontier_dict = {start: metrics["node_h_value"][start]}
 
         # Initialize tracking variables
-        visited_order = [start]
         closed_set = set()  # Nodes already expanded
         parent = {start: None}
         g_value = {start: 0}  # Still tracking g for path reconstruction
-        exploration_history = []
+
+        # Frontier changes are recorded as (h, node) entries
+        exploration_history = ExplorationHistory(
+            partial(self._reconstruct_path, parent, start),
+            initial_frontier=[(metrics["node_h_value"][start], start)],
+            sort_key=self._display_order,
+            sink=self.config.exploration_sink
+        )
+
+        # Bind attribute lookups once instead of on every iteration
+        graph_get = self.env.graph.get
+        step_cost = self.env.get_step_cost
+        manhattan = self.env.calculate_manhattan_distance
+        push = frontier.push
+        pop = frontier.pop
 
         steps = 0
-        max_steps = self.config.max_steps or float('inf')
+        max_steps = self.config.max_steps or sys.maxsize
 
         while frontier and steps < max_steps:
-            steps += 1
+            # Get node with lowest h-value (which is f for Greedy)
+            h_value, _, current_node = pop()
 
-            # Sort frontier by h-value (which is f for Greedy)
-            frontier.sort(key=lambda x: x[0])
-            frontier_before = frontier.copy() if self.config.show_exploration else None
+            # Skip entries that no longer match the frontier (lazy deletion); an
+            # old entry can also resurface after its node has already been expanded
+            if current_node in closed_set or frontier_dict.get(current_node) != h_value:
+                continue
 
-            # Get node with lowest h-value
-            h_value, current_node = frontier.pop(0)
+            steps += 1
             del frontier_dict[current_node]
 
             # Add to closed set
@@ -55,7 +82,7 @@ class GreedyBestFirstSearch(InformedSearch):
                 final_path = self._reconstruct_path(parent, start, goal)
                 return self.create_search_result(
                     path=final_path,
-                    visited_order=visited_order,
+                    visited_order=list(metrics["node_discovery"]),
                     success=True,
                     steps=steps,
                     exploration_history=exploration_history,
@@ -64,71 +91,131 @@ class GreedyBestFirstSearch(InformedSearch):
 
             # Process neighbors
             neighbors_added = []
-            for neighbor in self.env.graph.get(current_node, []):
+            frontier_removed = [(h_value, current_node)]
+            for neighbor in graph_get(current_node, []):
                 if neighbor in closed_set:
                     continue
 
                 # Calculate tentative g-value (not used for expansion decisions but for tracking)
-                tentative_g = g_value[current_node] + self.env.get_step_cost(current_node, neighbor)
+                tentative_g = g_value[current_node] + step_cost(current_node, neighbor)
 
                 # Check if we should update this node
                 if self._should_update_node(neighbor, tentative_g, g_value, frontier_dict):
+                    if neighbor in frontier_dict:
+                        frontier_removed.append((frontier_dict[neighbor], neighbor))
+
                     # Update path info
                     parent[neighbor] = current_node
                     g_value[neighbor] = tentative_g
 
                     # Calculate heuristic
-                    h = self.env.calculate_manhattan_distance(neighbor, goal)
+                    h = manhattan(neighbor, goal)
                     f = self._calculate_f(tentative_g, h)  # For Greedy, f = h
 
                     # Update metrics
                     if neighbor not in metrics["node_discovery"]:
                         metrics["node_discovery"][neighbor] = steps
-                        visited_order.append(neighbor)
 
                     metrics["node_h_value"][neighbor] = h
                     metrics["node_g_value"][neighbor] = tentative_g
                     metrics["node_f_value"][neighbor] = f
 
-                    # Update frontier
-                    if neighbor in frontier_dict:
-                        # Remove old entry (frontier contains tuples)
-                        frontier = [(f_val, n) for f_val, n in frontier if n != neighbor]
-
-                    # Add with new values
-                    frontier.append((f, neighbor))
+                    # Update frontier (any older entry for this node becomes stale)
+                    push((f, next(counter), neighbor))
                     frontier_dict[neighbor] = f
                     neighbors_added.append((f, neighbor))
 
-            # Record exploration history
-            if self.config.show_exploration:
-                current_partial_path = self._reconstruct_path(parent, start, current_node) if current_node != start else [start]
-
-                step_info = self._create_step_info(
-                    current_node, steps, neighbors_added,
-                    frontier_before, frontier.copy(),
-                    metrics
-                )
-
-                exploration_history.append((
-                    closed_set.copy(),
-                    frontier.copy(),
-                    current_partial_path,
-                    step_info
-                ))
+            # Record exploration history (paths are rebuilt from parent when replayed)
+            step_info = self._create_step_info(current_node, steps, neighbors_added, metrics)
+            exploration_history.record(current_node, neighbors_added, frontier_removed, step_info)
 
         # No path found
         return self.create_search_result(
             path=None,
-            visited_order=visited_order,
+            visited_order=list(metrics["node_discovery"]),
             success=False,
             steps=steps,
             exploration_history=exploration_history,
             **metrics
         )
 
+    def _search_fast(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Perform Greedy Best-First Search without educational tracking."""
+        env = self.env
+        adjacency = env.adjacency
+        h_table = env.manhattan_table(goal)
+        start_id = env.pack(start)
+        goal_id = env.pack(goal)
+        h_start = h_table[start_id]
+
+        # Same (f=h, insertion_order, node) entries as _search_traced, with
+        # nodes as packed ids
+        counter = count()
+        frontier = self._create_frontier(start)
+        frontier.push((h_start, next(counter), start_id))
+
+        # Per-node state preallocated over all packed ids. Each node is pushed
+        # at most once, so discovered (frontier or closed) is the only test needed
+        discovered = bytearray(len(adjacency))
+        discovered[start_id] = 1
+        parent = [None] * len(adjacency)
+        node_discovery = {start_id: 0}
+        node_expansion = {}
+
+        push = frontier.push
+        pop = frontier.pop
+
+        steps = 0
+        max_steps = self.config.max_steps or sys.maxsize
+        found = False
+
+        while frontier and steps < max_steps:
+            _, _, current_node = pop()
+
+            steps += 1
+            node_expansion[current_node] = steps
+
+            if current_node == goal_id:
+                found = True
+                break
+
+            for neighbor in adjacency[current_node]:
+                # Greedy never revisits a node once it is in the frontier or closed
+                if discovered[neighbor]:
+                    continue
+
+                discovered[neighbor] = 1
+                parent[neighbor] = current_node
+                node_discovery[neighbor] = steps
+
+                # Goal test on generation: only the goal has h = 0, so it would be
+                # the very next pop; it is not queued, and its expansion is counted
+                # once the rest of this node's neighbors have been discovered
+                if neighbor == goal_id and steps < max_steps:
+                    found = True
+                    continue
+
+                push((h_table[neighbor], next(counter), neighbor))
+
+            if found:
+                steps += 1
+                node_expansion[goal_id] = steps
+                break
+
+        return self._create_packed_result(
+            path=self._reconstruct_path(parent, start_id, goal_id) if found else None,
+            success=found,
+            steps=steps,
+            node_discovery=node_discovery,
+            node_expansion=node_expansion
+        )
+
     def visualize_search(self, result: SearchResult, delay: float = None) -> None:
         """Visualize Greedy Best-First Search with heuristic information."""
+        # Imported here so headless searches never load matplotlib or IPython
+        import matplotlib.pyplot as plt
+        from IPython.display import clear_output
+
         if not result.exploration_history:
             print(f"No exploration history available for {self.name}")
             return
@@ -0,0 +1,75 @@
+import heapq
+
+
+class HeapQueue:
+    """Binary-heap priority queue over comparable entry tuples.
+
+    Entries are ordered by the full tuple, so callers put the priority first
+    and append tie-breakers (such as an insertion counter) after it.
+    """
+
+    def __init__(self):
+        self._heap = []
+
+    def push(self, entry):
+        """Add an entry to the queue."""
+        heapq.heappush(self._heap, entry)
+
+    def pop(self):
+        """Remove and return the entry with the lowest priority."""
+        return heapq.heappop(self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        """Iterate over entries in the order they would be popped."""
+        return iter(sorted(self._heap))
+
+
+class BucketQueue:
+    """Bucket (monotone) priority queue for small non-negative integer priorities.
+
+    Entries are tuples whose first element is the integer priority. Each
+    priority gets its own bucket, so locating the minimum is O(1) amortized
+    instead of a heap sift across the whole frontier. This suits uniform-cost
+    mazes where f-values and Manhattan distances are small integers bounded by
+    the maze size.
+
+    Entries sharing a priority are kept in a small heap, so ties are broken by
+    the remaining tuple fields exactly as in HeapQueue.
+    """
+
+    def __init__(self):
+        self._buckets = []
+        self._min = 0  # Lowest priority that may still hold entries
+        self._size = 0
+
+    def push(self, entry):
+        """Add an entry to the bucket matching its priority."""
+        priority = entry[0]
+        buckets = self._buckets
+        while priority >= len(buckets):
+            buckets.append([])
+        heapq.heappush(buckets[priority], entry)
+        if priority < self._min:
+            self._min = priority
+        self._size += 1
+
+    def pop(self):
+        """Remove and return the entry with the lowest priority."""
+        if not self._size:
+            raise IndexError("pop from an empty BucketQueue")
+        buckets = self._buckets
+        while not buckets[self._min]:
+            self._min += 1
+        self._size -= 1
+        return heapq.heappop(buckets[self._min])
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Iterate over entries in the order they would be popped."""
+        for bucket in self._buckets[self._min:]:
+            yield from sorted(bucket)
@@ -1,9 +1,13 @@
-from abc import abstractmethod
+import sys
+from collections import deque
+from functools import partial
 from typing import Tuple, List
-from IPython.display import clear_output
-import matplotlib.pyplot as plt
+import numpy as np
 
 from ..base import SearchAlgorithmBase
+from ...core._grid_kernels import traverse_grid, warmup
+from ...core._numba import NUMBA_AVAILABLE
+from ...core.history import ExplorationHistory
 from ...core.results import SearchResult
 
 
@@ -11,57 +15,75 @@ class UninformedSearch(SearchAlgorithmBase):
     """Base class for uninformed search algorithms (BFS, DFS).
 
     Uninformed search algorithms don't use domain knowledge beyond the problem definition.
-    They differ primarily in their frontier data structure and expansion strategy.
+    They differ primarily in their expansion strategy: the frontier is a deque
+    popped from the front (FIFO, BFS) or the back (LIFO, DFS). Without
+    exploration visualization, the search runs as a compiled Numba kernel
+    over the grid when Numba is installed, and otherwise over packed node
+    ids instead of (row, col) tuples.
+
+    Attributes:
+        frontier_name (str): Algorithm-specific frontier name used in step info.
+        lifo (bool): Whether the most recently added node is expanded first.
+        compiled (bool): Whether search() may run the compiled Numba kernel.
+            Subclasses with their own search() pass False.
     """
 
-    def __init__(self, *args, frontier_name="frontier", **kwargs):
+    def __init__(self, *args, frontier_name="frontier", lifo=False, compiled=True, **kwargs):
         super().__init__(*args, **kwargs)
         self.frontier_name = frontier_name
+        self.lifo = lifo
+        self.compiled = compiled and NUMBA_AVAILABLE
+        # Compile the Numba kernel up front so run() doesn't time JIT compilation
+        if self.compiled and not self.config.show_exploration:
+            warmup()
 
-    @abstractmethod
     def _initialize_frontier(self, start):
         """Initialize frontier data structure with start node."""
-        raise NotImplementedError("Subclasses must implement _initialize_frontier")
-
-    @abstractmethod
-    def _get_next_node(self, frontier):
-        """Get the next node from frontier based on search strategy (FIFO, LIFO, etc.)."""
-        raise NotImplementedError("Subclasses must implement _get_next_node")
-
-    def _add_to_frontier(self, frontier, node):
-        """Add a node to frontier according to search strategy."""
-        frontier.append(node)
+        return deque([start])
 
     def _frontier_representation(self, frontier):
         """Return a representation of frontier suitable for visualization."""
         return list(frontier)
 
     def search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
-        """Generic uninformed search implementation."""
+        """Run the traced search when exploring is visualized, otherwise the fastest one available."""
+        if self.config.show_exploration:
+            return self._search_traced(start, goal)
+        if self.compiled:
+            return self._search_compiled(start, goal)
+        return self._search_fast(start, goal)
+
+    def _search_traced(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Generic uninformed search implementation, recording exploration history."""
         # Initialize data structures
         frontier = self._initialize_frontier(start)
-        visited = set([start])
-        visited_order = [start]
         parent = {start: None}
-        exploration_history = []
-        node_discovery = {start: 0}
+        node_discovery = {start: 0}  # Doubles as the visited set; insertion order is the visit order
         node_expansion = {}
 
+        # Bind attribute lookups once instead of on every iteration; the frontier
+        # is popped through the bound deque method chosen by the strategy
+        graph_get = self.env.graph.get
+        get_next_node = frontier.pop if self.lifo else frontier.popleft
+        add_to_frontier = frontier.append
+
+        # Frontier changes are recorded as diffs; every discovered node counts as visited
+        exploration_history = ExplorationHistory(
+            partial(self._reconstruct_path, parent, start),
+            initial_frontier=self._frontier_representation(frontier),
+            frontier_name=self.frontier_name,
+            mark_discovered=True,
+            sink=self.config.exploration_sink
+        )
+
         steps = 0
-        max_steps = self.config.max_steps or float("inf")
+        max_steps = self.config.max_steps or sys.maxsize
 
         while frontier and steps < max_steps:
             steps += 1
 
-            # Save frontier state for visualization if needed
-            frontier_before = (
-                self._frontier_representation(frontier)
-                if self.config.show_exploration
-                else None
-            )
-
             # Get next node to explore (algorithm-specific)
-            current_node = self._get_next_node(frontier)
+            current_node = get_next_node()
             node_expansion[current_node] = steps
 
             # Check if goal is reached
@@ -69,7 +91,7 @@ class UninformedSearch(SearchAlgorithmBase):
                 final_path = self._reconstruct_path(parent, start, goal)
                 return self.create_search_result(
                     path=final_path,
-                    visited_order=visited_order,
+                    visited_order=list(node_discovery),
                     success=True,
                     steps=steps,
                     exploration_history=exploration_history,
@@ -79,45 +101,21 @@ class UninformedSearch(SearchAlgorithmBase):
 
             # Process neighbors
             neighbors_added = []
-            for neighbor in self.env.graph.get(current_node, []):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    visited_order.append(neighbor)
+            for neighbor in graph_get(current_node, []):
+                if neighbor not in node_discovery:
                     parent[neighbor] = current_node
-                    self._add_to_frontier(frontier, neighbor)
+                    add_to_frontier(neighbor)
                     node_discovery[neighbor] = steps
                     neighbors_added.append(neighbor)
 
-            # Record exploration history
-            if self.config.show_exploration:
-                current_partial_path = (
-                    self._reconstruct_path(parent, start, current_node)
-                    if current_node != start
-                    else [start]
-                )
-
-                # Create step info dictionary (using algorithm-specific names)
-                step_info = self._create_step_info(
-                    current_node,
-                    steps,
-                    neighbors_added,
-                    frontier_before,
-                    self._frontier_representation(frontier),
-                )
-
-                exploration_history.append(
-                    (
-                        visited.copy(),
-                        self._frontier_representation(frontier),
-                        current_partial_path,
-                        step_info,
-                    )
-                )
+            # Record exploration history (frontier snapshots and paths are rebuilt when replayed)
+            step_info = self._create_step_info(current_node, steps, neighbors_added)
+            exploration_history.record(current_node, neighbors_added, [current_node], step_info)
 
         # No path found
         return self.create_search_result(
             path=None,
-            visited_order=visited_order,
+            visited_order=list(node_discovery),
             success=False,
             steps=steps,
             exploration_history=exploration_history,
@@ -125,23 +123,78 @@ class UninformedSearch(SearchAlgorithmBase):
             node_expansion=node_expansion,
         )
 
-    def _create_step_info(
-        self, current_node, steps, neighbors_added, frontier_before, frontier_after
-    ):
-        """Create step info dictionary for visualization."""
+    def _search_fast(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Run the same search over packed node ids, without exploration history."""
+        env = self.env
+        adjacency = env.adjacency
+        start_id = env.pack(start)
+        goal_id = env.pack(goal)
+
+        frontier = self._initialize_frontier(start_id)
+        get_next_node = frontier.pop if self.lifo else frontier.popleft
+        add_to_frontier = frontier.append
+
+        # Per-node state preallocated over all packed ids
+        discovered = bytearray(len(adjacency))
+        discovered[start_id] = 1
+        parent = [None] * len(adjacency)
+        node_discovery = {start_id: 0}
+        node_expansion = {}
+
+        steps = 0
+        max_steps = self.config.max_steps or sys.maxsize
+        found = False
+
+        while frontier and steps < max_steps:
+            steps += 1
+            current_node = get_next_node()
+            node_expansion[current_node] = steps
+
+            if current_node == goal_id:
+                found = True
+                break
+
+            for neighbor in adjacency[current_node]:
+                if not discovered[neighbor]:
+                    discovered[neighbor] = 1
+                    parent[neighbor] = current_node
+                    add_to_frontier(neighbor)
+                    node_discovery[neighbor] = steps
+
+        return self._create_packed_result(
+            path=self._reconstruct_path(parent, start_id, goal_id) if found else None,
+            success=found,
+            steps=steps,
+            node_discovery=node_discovery,
+            node_expansion=node_expansion
+        )
+
+    def _search_compiled(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Run the Numba traversal kernel on the maze grid and convert its output to a SearchResult."""
+        grid = np.ascontiguousarray(self.env.grid, dtype=np.int8)
+        return self._create_kernel_result(*traverse_grid(
+            grid, start[0], start[1], goal[0], goal[1], self.lifo, self.config.max_steps or -1))
+
+    def _create_step_info(self, current_node, steps, neighbors_added):
+        """Create step info dictionary for visualization.
+
+        Frontier snapshots (``frontier_before``/``frontier_after`` and their
+        ``<frontier_name>_`` aliases) are added when the exploration history
+        is replayed.
+        """
         info = {
             "step": steps,
             "expanded_node": current_node,
             "neighbors_added": neighbors_added,
-            "frontier_before": frontier_before,
-            "frontier_after": frontier_after,
-            f"{self.frontier_name}_before": frontier_before,
-            f"{self.frontier_name}_after": frontier_after,
         }
         return info
 
     def visualize_search(self, result: SearchResult, delay: float = None) -> None:
         """Visualize the search process step by step."""
+        # Imported here so headless searches never load matplotlib or IPython
+        import matplotlib.pyplot as plt
+        from IPython.display import clear_output
+
         if not result.exploration_history:
             print(f"No exploration history available for {self.name}")
             return
@@ -0,0 +1,119 @@
+import sys
+from collections import deque
+from typing import Tuple
+
+from .base import UninformedSearch
+from ...core.history import ExplorationHistory
+from ...core.results import SearchResult
+
+
+class BidirectionalBreadthFirstSearch(UninformedSearch):
+    """Bidirectional Breadth-First Search (two FIFO queues meeting in the middle).
+
+    Runs breadth-first search forward from the start and backward from the goal,
+    expanding one full layer of the smaller queue at a time, until a node
+    discovered by one side is reached by the other. Each side only has to reach
+    about half the solution depth, so it explores roughly O(b^(d/2)) nodes
+    instead of O(b^d) while still returning a shortest path.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # search() is pure Python, so the traversal kernel is never compiled
+        super().__init__(*args, frontier_name="queue", lifo=False, compiled=False, **kwargs)
+
+    def search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Search from both ends over packed node ids, recording history when visualized."""
+        env = self.env
+        adjacency = env.adjacency
+        coords = env.coords
+        start_id = env.pack(start)
+        goal_id = env.pack(goal)
+        show_exploration = self.config.show_exploration
+
+        # Index 0 searches forward from the start, index 1 backward from the goal
+        frontiers = (deque([start_id]), deque([goal_id]))
+        parents = ([None] * len(adjacency), [None] * len(adjacency))
+        owner = bytearray(len(adjacency))  # 0 if undiscovered, else 1 + the discovering side
+        owner[start_id] = 1
+        owner[goal_id] = 2
+        depth = [0] * len(adjacency)  # Distance from the discovering side's root
+        node_discovery = {start_id: 0, goal_id: 0}
+        node_expansion = {}
+
+        def path_to(node):
+            """Path from the root of the side that discovered node, in (row, col)."""
+            if owner[node] == 1:
+                ids = self._reconstruct_path(parents[0], start_id, node)
+            else:
+                ids = self._reconstruct_path(parents[1], goal_id, node)
+            return [coords[idx] for idx in ids]
+
+        exploration_history = ExplorationHistory(
+            lambda node: path_to(env.pack(node)),
+            initial_frontier=[start, goal] if start_id != goal_id else [start],
+            frontier_name=self.frontier_name,
+            mark_discovered=True,
+            sink=self.config.exploration_sink
+        ) if show_exploration else []
+
+        steps = 0
+        max_steps = self.config.max_steps or sys.maxsize
+        meeting = None  # (forward node, backward node) of the shortest connection found
+        best_length = sys.maxsize
+
+        if start_id == goal_id:
+            steps = 1
+            node_expansion[start_id] = steps
+            meeting = (start_id, None)
+
+        while meeting is None and frontiers[0] and frontiers[1] and steps < max_steps:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            frontier = frontiers[side]
+            parent = parents[side]
+            mine, other = side + 1, 2 - side
+
+            # Expand the whole layer so every connection at this depth is compared
+            for _ in range(len(frontier)):
+                if steps >= max_steps:
+                    break
+                current_node = frontier.popleft()
+                steps += 1
+                node_expansion[current_node] = steps
+
+                neighbors_added = []
+                current_depth = depth[current_node] + 1
+                for neighbor in adjacency[current_node]:
+                    if not owner[neighbor]:
+                        owner[neighbor] = mine
+                        parent[neighbor] = current_node
+                        depth[neighbor] = current_depth
+                        frontier.append(neighbor)
+                        node_discovery[neighbor] = steps
+                        neighbors_added.append(neighbor)
+                    elif owner[neighbor] == other and current_depth + depth[neighbor] < best_length:
+                        best_length = current_depth + depth[neighbor]
+                        meeting = (current_node, neighbor) if side == 0 else (neighbor, current_node)
+
+                if show_exploration:
+                    added = [coords[idx] for idx in neighbors_added]
+                    step_info = self._create_step_info(coords[current_node], steps, added)
+                    step_info["direction"] = "forward" if side == 0 else "backward"
+                    exploration_history.record(coords[current_node], added, [coords[current_node]], step_info)
+
+        path = None
+        if meeting is not None:
+            forward_node, backward_node = meeting
+            path = self._reconstruct_path(parents[0], start_id, forward_node)
+            if backward_node is not None:
+                backward = self._reconstruct_path(parents[1], goal_id, backward_node)
+                backward.reverse()
+                path.extend(backward)
+
+        return self._create_packed_result(
+            path=path,
+            success=path is not None,
+            steps=steps,
+            node_discovery=node_discovery,
+            node_expansion=node_expansion,
+            exploration_history=exploration_history
+        )
@@ -0,0 +1,36 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Iterable, List, Optional, Type
+
+from ..algorithms.base import SearchAlgorithmBase
+from ..core.config import Config
+from ..core.environment import MazeEnvironment
+from ..core.results import SearchResult
+
+
+def solve_many(config: Config, seeds: Iterable[int], algorithm: Type[SearchAlgorithmBase],
+               max_workers: Optional[int] = None) -> List[SearchResult]:
+    """Solve one maze per seed with the same algorithm, concurrently on a thread pool.
+
+    Each task builds an environment from ``config`` with ``maze_id`` set to its
+    seed and runs the algorithm on it. With Numba installed and
+    ``show_exploration`` off, the searches run as compiled kernels that release
+    the GIL, so they proceed in parallel; maze generation and graph building are
+    Python code and take turns on the GIL.
+
+    Args:
+        config: Base configuration; maze_id is replaced by each seed.
+        seeds: Seeds of the mazes to solve.
+        algorithm: Search algorithm class to run on every maze.
+        max_workers: Number of worker threads. Defaults to the CPU count.
+
+    Returns:
+        One SearchResult per seed, in seed order.
+    """
+    def solve(seed: int) -> SearchResult:
+        env = MazeEnvironment(replace(config, maze_id=seed))
+        return algorithm(env).run()
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(solve, seeds))
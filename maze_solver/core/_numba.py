@@ -0,0 +1,18 @@
+try:
+    import numba
+except ImportError:  # Numba is optional; kernels then run through the pure Python searches
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def njit(*args, **kwargs):
+    """Compile with ``numba.njit`` when Numba is installed, otherwise leave the function as is.
+
+    Supports both the bare ``@njit`` and the ``@njit(cache=True)`` forms.
+    """
+    if NUMBA_AVAILABLE:
+        return numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
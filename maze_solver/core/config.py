@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration parameters for maze generation and search algorithms.
 
     This class centralizes all configuration options for maze environments and search
-    algorithms to ensure consistent parameter usage throughout the system.
+    algorithms to ensure consistent parameter usage throughout the system. Configs are
+    immutable (and hashable); use ``dataclasses.replace`` to derive a modified copy.
 
     Attributes:
         maze_size (int): Grid dimensions (nxn) of the maze. Default is 5x5.
@@ -15,6 +16,10 @@ class Config:
         show_exploration (bool): Whether to visualize the exploration process. Default is True.
         max_steps (Optional[int]): Maximum steps for search algorithm execution before termination.
                                   None means unlimited steps allowed.
+        exploration_sink (Optional[str]): Directory to spool exploration histories to as compressed
+                                  files instead of keeping them in memory, for very large mazes.
+                                  None keeps histories in memory. Each file is deleted when its
+                                  history is garbage collected.
     """
     # Maze parameters
     maze_size: int = 5  # Grid dimensions (nxn)
@@ -25,4 +30,5 @@ class Config:
     show_exploration: bool = True  # Whether to visualize exploration
 
     # Search parameters
-    max_steps: Optional[int] = None  # Maximum steps for search (None for unlimited)
\ No newline at end of file
+    max_steps: Optional[int] = None  # Maximum steps for search (None for unlimited)
+    exploration_sink: Optional[str] = None  # Directory to spool exploration history to (None for memory)
\ No newline at end of file
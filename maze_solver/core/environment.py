@@ -1,15 +1,121 @@
-from typing import Tuple, List, Optional, Set
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from numbers import Integral
+from typing import Dict, Tuple, List, Optional, Set
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from mazelib import Maze
-from mazelib.generate.Sidewinder import Sidewinder
-from mazelib.solve.BacktrackingSolver import BacktrackingSolver
-
 from .config import Config
 
+
+@dataclass(frozen=True)
+class MazeData:
+    """A generated maze and its solution, shared by environments with the same size and seed.
+
+    Attributes:
+        grid (numpy.ndarray): Read-only binary maze representation (0=path, 1=wall).
+        start (Tuple[int, int]): Starting position, the first valid cell inside the grid.
+        end (Tuple[int, int]): Goal position, the last valid cell inside the grid.
+        optimal_path (Optional[Tuple[Tuple[int, int], ...]]): Solver's solution from start
+            to end, or None if no solution was found.
+    """
+    grid: np.ndarray
+    start: Tuple[int, int]
+    end: Tuple[int, int]
+    optimal_path: Optional[Tuple[Tuple[int, int], ...]]
+
+
+@lru_cache(maxsize=None)
+def _maze_style() -> tuple:
+    """Colormap, norm and legend handles for MazeEnvironment.visualize, built once.
+
+    Legend handles are only used as style templates, so every figure can share them.
+    matplotlib is imported here rather than at module level, so headless runs that
+    never draw a maze don't pay for importing it.
+    """
+    from matplotlib.colors import BoundaryNorm, ListedColormap
+    from matplotlib.patches import Rectangle
+
+    # Define colors: Wall, Visited, Final Path, Start, Goal, Unvisited
+    cmap = ListedColormap(['black', 'yellow', 'green', 'blue', 'purple', 'white'])
+    bounds = [-0.5, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
+    norm = BoundaryNorm(bounds, cmap.N)
+
+    legend_elements = (
+        Rectangle((0,0), 1, 1, color='white', label='Path'),
+        Rectangle((0,0), 1, 1, color='yellow', label='Visited'),
+        Rectangle((0,0), 1, 1, color='black', label='Wall'),
+        Rectangle((0,0), 1, 1, color='green', label='Final Path'),
+        Rectangle((0,0), 1, 1, color='blue', label='Start'),
+        Rectangle((0,0), 1, 1, color='purple', label='Goal')
+    )
+    return cmap, norm, legend_elements
+
+
+def _cell_indices(cells) -> Tuple[np.ndarray, np.ndarray]:
+    """Row and column index arrays for a collection of (row, col) cells, for fancy indexing.
+
+    cells may also be an (N, 2) array of rows and columns, whose columns are returned as is.
+    """
+    if isinstance(cells, np.ndarray):
+        return cells[:, 0], cells[:, 1]
+    flat = np.fromiter(chain.from_iterable(cells), dtype=np.intp, count=2 * len(cells))
+    return flat[0::2], flat[1::2]
+
+
+# mazelib seeds and draws from the global random generators, so concurrent generation
+# (e.g. a threaded benchmark) must be serialized to keep mazes reproducible per seed
+_generation_lock = threading.Lock()
+
+
+@lru_cache(maxsize=64)
+def _build_maze(size: int, seed: int) -> MazeData:
+    """Generate a maze with the Sidewinder algorithm and find its shortest solution.
+
+    Generation and solving are deterministic for a given size and seed, so
+    results are memoized; notebooks and dashboards that create an environment
+    per algorithm reuse the same maze instead of regenerating it.
+
+    Args:
+        size: Maze dimensions (nxn) in cells.
+        seed: Seed for maze generation.
+
+    Returns:
+        The generated maze, with its grid marked read-only since it is shared.
+    """
+    # Imported on first use, like matplotlib; cached mazes never need mazelib
+    from mazelib import Maze
+    from mazelib.generate.Sidewinder import Sidewinder
+    from ._grid_kernels import traverse_grid
+
+    with _generation_lock:
+        maze = Maze(seed)
+        maze.generator = Sidewinder(size, size)
+        maze.generate()
+        maze.generate_entrances()
+
+    grid = maze.grid
+    grid.setflags(write=False)
+
+    # Start at the first valid cell inside grid, end at the last one
+    start = (1, 1)
+    end = (grid.shape[0]-2, grid.shape[1]-2)
+
+    # Calculate optimal path with the BFS kernel: on a unit-cost grid the BFS path is a
+    # shortest path, found in one linear pass where mazelib's backtracking solver is
+    # superlinear in the maze size
+    path_ids = traverse_grid(np.ascontiguousarray(grid, dtype=np.int8),
+                             start[0], start[1], end[0], end[1], False, -1)[0]
+
+    # Like mazelib's solutions, the optimal path lists the cells between start and end
+    width = grid.shape[1]
+    optimal_path = tuple(divmod(idx, width) for idx in path_ids[1:-1].tolist()) if len(path_ids) else None
+    return MazeData(grid=grid, start=start, end=end, optimal_path=optimal_path)
+
+
 class MazeEnvironment:
     """Handles maze generation, state management and visualization.
 
@@ -19,12 +125,27 @@ class MazeEnvironment:
 
     Attributes:
         config (Config): Configuration parameters for the maze.
-        grid (numpy.ndarray): Binary maze representation (0=path, 1=wall).
+        grid (numpy.ndarray): Binary maze representation (0=path, 1=wall). Read-only, since
+            environments with the same size and seed share it.
         start (Tuple[int, int]): Starting position, typically (1,1).
         end (Tuple[int, int]): Goal position, typically at the bottom-right corner.
         optimal_path (List[Tuple[int, int]]): Shortest solution path from start to end.
         optimal_path_length (int): Length of the shortest solution path.
-        graph (Dict): Graph representation of maze for search algorithms.
+        graph (Dict): Graph representation of maze for search algorithms, built
+            from the packed adjacency on first access.
+        width (int): Number of grid columns, used to pack (row, col) into node ids.
+        walls (bytes): Wall mask indexed by packed id, 1 for walls and 0 for paths.
+        coords (List[Tuple[int, int]]): (row, col) of each packed id, None for walls.
+        adjacency (List[List[int]]): Packed ids of each node's neighbors, indexed by packed id.
+        edges (List[List[Tuple[int, float]]]): (neighbor id, step cost) pairs of each
+            node, indexed by packed id.
+        unit_step_costs (bool): Whether every edge costs exactly 1.
+        integer_step_costs (bool): Whether every edge cost is an integer.
+        neighbors (numpy.ndarray): Adjacency of packed node ids, shape (rows * cols, 4)
+            in up, right, down, left order, with -1 where there is no neighbor.
+        graph_csr (Tuple[numpy.ndarray, numpy.ndarray]): The same adjacency in
+            compressed sparse row form, ``(row_ptr, neighbors_flat)``: the neighbors
+            of packed id ``i`` are ``neighbors_flat[row_ptr[i]:row_ptr[i + 1]]``.
     """
 
     def __init__(self, config: Config):
@@ -37,11 +158,20 @@ class MazeEnvironment:
         self.grid = None
         self.start = None
         self.end = None
-        self._maze = None
         self.seed = None
         self.optimal_path = None
         self.optimal_path_length = None
-        self.graph = None
+        self._graph = None
+        self.width = None
+        self.walls = None
+        self.coords = None
+        self.adjacency = None
+        self.edges = None
+        self.unit_step_costs = None
+        self.integer_step_costs = None
+        self.neighbors = None
+        self.graph_csr = None
+        self._manhattan_tables = {}
         self.generate()
 
     def generate(self) -> None:
@@ -49,80 +179,112 @@ class MazeEnvironment:
 
         Generates a random maze based on configuration parameters, establishes
         start and end positions, calculates optimal path, and creates graph
-        representation for search algorithms.
+        representation for search algorithms. Mazes are cached by size and seed,
+        so the grid is shared and read-only.
         """
         # Use config maze_id if provided, otherwise generate random seed
         self.seed = self.config.maze_id if self.config.maze_id is not None else np.random.randint(1, 1000)
 
-        self._maze = Maze(self.seed)
-        self._maze.generator = Sidewinder(self.config.maze_size, self.config.maze_size)
-        self._maze.generate()
-        self._maze.generate_entrances()
+        maze = _build_maze(self.config.maze_size, int(self.seed))
+        self.grid = maze.grid
+        self.start = maze.start
+        self.end = maze.end
 
-        self.grid = self._maze.grid
-
-        # Set the start to the first valid cell inside grid
-        self.start = (1, 1)
-        # Set the end to the last valid cell inside grid
-        self.end = (self.grid.shape[0]-2, self.grid.shape[1]-2)
-
-        # After maze generation, calculate optimal path
-        self._calculate_optimal_path()
-
-        # Create graph representation for search algorithms
-        self._create_graph()
-
-    def _calculate_optimal_path(self) -> None:
-        """Calculate optimal path using maze's solver.
-
-        Uses the BacktrackingSolver to find the optimal solution path from
-        start to end. Sets optimal_path and optimal_path_length attributes.
-        """
-        # Set up solver
-        self._maze.solver = BacktrackingSolver()
-        self._maze.start = self.start
-        self._maze.end = self.end
-
-        # Solve
-        self._maze.solve()
-
-        if self._maze.solutions:
-            self.optimal_path = self._maze.solutions[0]  # Store first solution
+        if maze.optimal_path is not None:
+            self.optimal_path = list(maze.optimal_path)  # Own copy of the first solution
             self.optimal_path_length = len(self.optimal_path) + 1
         else:
             # Handle case where no solution is found
             self.optimal_path = None
             self.optimal_path_length = None
 
+        # Create graph representation for search algorithms
+        self._create_graph()
+
     def _create_graph(self) -> None:
         """Creates graph representation for search algorithms.
 
-        Transforms the grid-based maze into an adjacency list graph representation
-        where each non-wall cell is a node, and edges connect to adjacent non-wall cells.
+        Transforms the grid-based maze into an adjacency representation where each
+        non-wall cell is a node, and edges connect to adjacent non-wall cells. Nodes
+        are packed ``row * width + col`` ids; the adjacency is kept as Python lists
+        for the pure Python searches and as a fixed-width array and its CSR form
+        for array consumers. The (row, col) keyed ``graph`` dict is only built if
+        it is used. Step costs are looked up once per edge here, so searches don't
+        call get_step_cost for every neighbor they relax, and checked once to
+        tell searches whether they are all unit or integer costs.
+
+        Neighbors are found with whole-grid array operations rather than a
+        per-cell loop: a cell links to the cell one step away in each direction
+        when both are open, which is a shifted AND of the open-cell mask.
         """
-        self.graph = {}
+        self._graph = None
         rows, cols = self.grid.shape
+        self.width = cols
+        self.walls = (self.grid == 1).astype(np.uint8).tobytes()
+        self._manhattan_tables = {}
+
+        is_open = self.grid != 1
+        ids = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+
+        # Possible moves: up, right, down, left. Each mask marks open cells whose
+        # neighbor in that direction is inside the grid and open too
+        links = np.zeros((4, rows, cols), dtype=bool)
+        links[0, 1:, :] = is_open[1:, :] & is_open[:-1, :]
+        links[1, :, :-1] = is_open[:, :-1] & is_open[:, 1:]
+        links[2, :-1, :] = is_open[:-1, :] & is_open[1:, :]
+        links[3, :, 1:] = is_open[:, 1:] & is_open[:, :-1]
+        offsets = np.array([-cols, 1, cols, -1], dtype=np.int32)
+
+        neighbors = np.where(links, ids + offsets[:, None, None], -1)
+        self.neighbors = neighbors.reshape(4, rows * cols).T.copy()
+
+        # Row-major boolean indexing keeps each node's neighbors contiguous and in order
+        has_neighbor = self.neighbors >= 0
+        row_ptr = np.zeros(rows * cols + 1, dtype=np.int32)
+        np.cumsum(has_neighbor.sum(axis=1), out=row_ptr[1:])
+        self.graph_csr = (row_ptr, self.neighbors[has_neighbor])
+
+        # Python list views of the same adjacency for the pure Python searches
+        flat = self.graph_csr[1].tolist()
+        bounds = row_ptr.tolist()
+        self.adjacency = [flat[bounds[idx]:bounds[idx + 1]] for idx in range(rows * cols)]
+        self.coords = [
+            (idx // cols, idx % cols) if open_cell else None
+            for idx, open_cell in enumerate(is_open.ravel().tolist())
+        ]
+        coords = self.coords
+        step_cost = self.get_step_cost
+        self.edges = [
+            [(n, step_cost(coords[idx], coords[n])) for n in adjacent]
+            for idx, adjacent in enumerate(self.adjacency)
+        ]
+        costs = {cost for node_edges in self.edges for _, cost in node_edges}
+        self.unit_step_costs = costs <= {1}
+        self.integer_step_costs = all(isinstance(cost, Integral) for cost in costs)
 
-        # Define possible moves: up, right, down, left
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-
-        for r in range(rows):
-            for c in range(cols):
-                # Skip walls
-                if self.grid[r][c] == 1:
-                    continue
-
-                node = (r, c)
-                neighbors = []
-
-                # Check all four directions
-                for dr, dc in directions:
-                    nr, nc = r + dr, c + dc
-                    # Check if the neighbor is valid
-                    if self.is_valid_move((nr, nc)):
-                        neighbors.append((nr, nc))
+    @property
+    def graph(self) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """Adjacency list keyed by (row, col), as used by the traced searches.
 
-                self.graph[node] = neighbors
+        Built from the packed adjacency on first access and cached until the
+        maze is regenerated, so searches that work on packed ids never pay for it.
+        """
+        if self._graph is None:
+            coords = self.coords
+            self._graph = {
+                coords[idx]: [coords[n] for n in neighbors]
+                for idx, neighbors in enumerate(self.adjacency)
+                if coords[idx] is not None
+            }
+        return self._graph
+
+    def pack(self, state: Tuple[int, int]) -> int:
+        """Pack (row, col) coordinates into a single integer node id."""
+        return state[0] * self.width + state[1]
+
+    def is_open(self, idx: int) -> bool:
+        """Checks whether the cell with packed id ``idx`` is a path rather than a wall."""
+        return not self.walls[idx]
 
     def get_minimum_steps(self) -> Optional[int]:
         """Returns the length of optimal path if it exists.
@@ -144,13 +306,12 @@ class MazeEnvironment:
             False otherwise.
         """
         row, col = state
-        # check if the move goes outside of the grid or into a wall (1)
-        if (row < 0 or row >= self.grid.shape[0] or
-            col < 0 or col >= self.grid.shape[1] or
-            self.grid[state] == 1):
+        # check if the move goes outside of the grid
+        if col < 0 or col >= self.width or row < 0:
             return False
-        # move is valid
-        return True
+        idx = self.pack(state)
+        # check bounds on the packed id (covers rows past the end) and for a wall
+        return idx < len(self.walls) and self.is_open(idx)
 
     def visualize(self, path: Optional[List[Tuple[int, int]]] = None,
                   visited: Optional[Set[Tuple[int, int]]] = None,
@@ -160,7 +321,8 @@ class MazeEnvironment:
         """Displays or saves maze visualization with optional path and visited nodes.
 
         Creates a color-coded visualization of the maze showing walls, paths,
-        visited nodes, and solution paths.
+        visited nodes, and solution paths. Saved figures are rendered off-screen
+        without going through pyplot, so batch runs never touch a GUI backend.
 
         Args:
             path: Optional list of positions showing a solution path.
@@ -169,64 +331,49 @@ class MazeEnvironment:
             save_path: If provided, saves figure to this path instead of displaying.
             title: Optional title for the plot.
         """
-        plt.figure(figsize=(8, 8))
+        import matplotlib.pyplot as plt
+        from matplotlib.figure import Figure
+
+        # A standalone Figure is not registered with pyplot and renders with Agg on save
+        fig = Figure(figsize=(8, 8)) if save_path else plt.figure(figsize=(8, 8))
+        ax = fig.add_subplot()
 
         # Add title showing Maze ID and minimum steps
         if title:
-            plt.title(title)
+            ax.set_title(title)
         else:
-            plt.title(f"Maze #{self.seed} - Min Steps: {self.get_minimum_steps()}")
-
-        # Create a visualization grid filled with appropriate values for coloring
-        rows, cols = self.grid.shape
-        viz_grid = np.ones((rows, cols)) * 5  # Initialize with unvisited path value
+            ax.set_title(f"Maze #{self.seed} - Min Steps: {self.get_minimum_steps()}")
 
-        # Fill in walls
-        viz_grid[self.grid == 1] = 0  # Walls
+        # Create a visualization grid: walls (0), everything else unvisited path (5)
+        viz_grid = np.where(self.grid == 1, 0.0, 5.0)
 
-        # Fill in visited paths
+        # Fill in visited paths, only where the cell is a path
         if visited:
-            for pos in visited:
-                r, c = pos
-                if self.grid[r, c] == 0:  # Only if it's a path
-                    viz_grid[r, c] = 1  # Visited paths
+            rows, cols = _cell_indices(visited)
+            is_path = self.grid[rows, cols] == 0
+            viz_grid[rows[is_path], cols[is_path]] = 1  # Visited paths
 
-        # Fill in final path
+        # Fill in final path (start and end are marked over it below)
         if path:
-            for pos in path:
-                if pos != self.start and pos != self.end:
-                    r, c = pos
-                    viz_grid[r, c] = 2  # Final path
+            viz_grid[_cell_indices(path)] = 2  # Final path
 
         # Mark start and end
         viz_grid[self.start] = 3  # Start
         viz_grid[self.end] = 4    # Goal
 
-        # Define colors: Wall, Visited, Final Path, Start, Goal, Unvisited
-        cmap = plt.cm.colors.ListedColormap(['black', 'yellow', 'green', 'blue', 'purple', 'white'])
-        bounds = [-0.5, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
-        norm = plt.cm.colors.BoundaryNorm(bounds, cmap.N)
+        cmap, norm, legend_elements = _maze_style()
 
         # Plot the maze
-        plt.imshow(viz_grid, cmap=cmap, norm=norm)
-        plt.xticks([])
-        plt.yticks([])
+        ax.imshow(viz_grid, cmap=cmap, norm=norm)
+        ax.set_xticks([])
+        ax.set_yticks([])
 
         # Add legend
-        legend_elements = [
-            plt.Rectangle((0,0), 1, 1, color='white', label='Path'),
-            plt.Rectangle((0,0), 1, 1, color='yellow', label='Visited'),
-            plt.Rectangle((0,0), 1, 1, color='black', label='Wall'),
-            plt.Rectangle((0,0), 1, 1, color='green', label='Final Path'),
-            plt.Rectangle((0,0), 1, 1, color='blue', label='Start'),
-            plt.Rectangle((0,0), 1, 1, color='purple', label='Goal')
-        ]
-        plt.legend(handles=legend_elements, loc='upper center',
+        ax.legend(handles=legend_elements, loc='upper center',
                   bbox_to_anchor=(0.5, -0.05), ncol=3)
 
         if save_path:
-            plt.savefig(save_path, bbox_inches='tight')
-            plt.close()
+            fig.savefig(save_path, bbox_inches='tight')
         else:
             plt.show()
 
@@ -234,6 +381,25 @@ class MazeEnvironment:
         """Calculate Manhattan distance heuristic from state to goal."""
         return abs(state[0] - goal[0]) + abs(state[1] - goal[1])
 
+    def manhattan_table(self, goal: Tuple[int, int]) -> List[int]:
+        """Manhattan distance from every cell to goal, indexed by packed id.
+
+        Computed in one vectorized pass over the grid and cached per goal, so
+        searches look heuristics up instead of computing them per neighbor.
+
+        Args:
+            goal: Target coordinates (row, col).
+
+        Returns:
+            List of distances with one entry per packed id.
+        """
+        table = self._manhattan_tables.get(goal)
+        if table is None:
+            rows, cols = np.indices(self.grid.shape)
+            distances = np.abs(rows - goal[0]) + np.abs(cols - goal[1])
+            table = self._manhattan_tables[goal] = distances.ravel().tolist()
+        return table
+
     def calculate_euclidean_distance(self, state: Tuple[int, int], goal: Tuple[int, int]) -> float:
         """Calculate Euclidean distance heuristic from state to goal."""
         return ((state[0] - goal[0]) ** 2 + (state[1] - goal[1]) ** 2) ** 0.5
@@ -0,0 +1,153 @@
+import contextlib
+import gzip
+import os
+import pickle
+import tempfile
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+class ExplorationHistory:
+    """Diff-encoded exploration history that replays full snapshots on demand.
+
+    Copying the closed set and frontier at every step costs O(steps x nodes)
+    memory. Instead, each step stores only what changed: the expanded node,
+    the frontier entries pushed and removed, and the step info. Iterating
+    replays these diffs and yields the same
+    ``(closed_set, frontier, current_path, step_info)`` tuples visualizations
+    consume, with ``frontier_before`` and ``frontier_after`` added to each
+    step info. The current path is rebuilt from parent pointers at replay time.
+
+    With a ``sink`` directory, steps are pickled into their own gzip file as
+    they are recorded instead of being kept in memory, so resident memory
+    stays constant however long the search runs. The spool file is closed when
+    the search returns its result and deleted when the history is garbage
+    collected; copies made by pickling read the same file and leave it in place.
+
+    Attributes:
+        path_to (Callable): Returns the path from the start to a given node.
+            Expanded nodes never change parent afterwards, so the search's
+            final parent pointers rebuild each step's path exactly.
+        sort_key (Optional[Callable]): Key ordering frontier entries for display
+            (priority order for informed search). None keeps insertion order.
+        frontier_name (Optional[str]): Algorithm-specific frontier name; when
+            set, step info also gets ``<name>_before`` and ``<name>_after``.
+        mark_discovered (bool): Whether pushed entries also join the closed
+            set, for searches that report discovered rather than expanded nodes.
+        path (Optional[str]): File the steps are spooled to, or None when they
+            are kept in memory.
+    """
+
+    def __init__(self, path_to: Callable, initial_frontier: Iterable = (),
+                 sort_key: Optional[Callable] = None, frontier_name: Optional[str] = None,
+                 mark_discovered: bool = False, sink: Optional[str] = None):
+        """Initialize an empty history.
+
+        Args:
+            path_to: Callable returning the path from the start to a node.
+            initial_frontier: Frontier entries present before the first step.
+            sort_key: Key ordering frontier entries for display, or None for
+                insertion order.
+            frontier_name: Optional algorithm-specific frontier name for step info aliases.
+            mark_discovered: Whether pushed entries are added to the closed set.
+            sink: Optional directory to spool steps to instead of memory.
+        """
+        self.path_to = path_to
+        self.sort_key = sort_key
+        self.frontier_name = frontier_name
+        self.mark_discovered = mark_discovered
+        self._initial_frontier = list(initial_frontier)
+        self._steps: List[Tuple] = []
+        self._length = 0
+        self._writer = None
+        self._owns_spool = False
+        self.path = None
+        if sink is not None:
+            # One file per history, so searches sharing a config don't overwrite each other
+            with tempfile.NamedTemporaryFile(dir=sink, prefix="exploration-", suffix=".pkl.gz",
+                                             delete=False) as spool:
+                self.path = spool.name
+            self._owns_spool = True
+            self._writer = gzip.open(self.path, "wb")
+
+    def record(self, expanded_node, pushed, removed, step_info) -> None:
+        """Record one search step as a diff against the previous one.
+
+        Args:
+            expanded_node: The node expanded (added to the closed set) in this step.
+            pushed: Frontier entries added in this step.
+            removed: Frontier entries removed in this step, including the
+                expanded node's own entry.
+            step_info: Algorithm-specific step information dictionary.
+        """
+        step = (expanded_node, tuple(pushed), tuple(removed), step_info)
+        self._length += 1
+        if self.path is None:
+            self._steps.append(step)
+            return
+        if self._writer is None:  # Reopened after a replay; gzip appends a new member
+            self._writer = gzip.open(self.path, "ab")
+        pickle.dump(step, self._writer, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        """Flush and close the spool file, if any. Replaying closes it too."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __getstate__(self):
+        """Pickle the history as another reader of the same spool file, which only the original deletes."""
+        self.close()
+        state = self.__dict__.copy()
+        state['_owns_spool'] = False
+        return state
+
+    def __del__(self):
+        """Close and delete the spool file this history created, if any."""
+        self.close()
+        if self._owns_spool:
+            with contextlib.suppress(OSError):
+                os.remove(self.path)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _recorded_steps(self) -> Iterator[Tuple]:
+        """Yield the recorded steps from memory or from the spool file."""
+        if self.path is None:
+            yield from self._steps
+            return
+        self.close()
+        with gzip.open(self.path, "rb") as spool:
+            while True:
+                try:
+                    yield pickle.load(spool)
+                except EOFError:
+                    return
+
+    def __iter__(self) -> Iterator[Tuple]:
+        """Replay the recorded diffs, yielding one full snapshot per step."""
+        frontier = dict.fromkeys(self._initial_frontier)  # Insertion-ordered set
+        closed_set = set(self._initial_frontier) if self.mark_discovered else set()
+        for expanded_node, pushed, removed, step_info in self._recorded_steps():
+            frontier_before = self._ordered(frontier)
+
+            closed_set.add(expanded_node)
+            for entry in removed:
+                frontier.pop(entry, None)
+            for entry in pushed:
+                frontier[entry] = None
+            if self.mark_discovered:
+                closed_set.update(pushed)
+
+            frontier_after = self._ordered(frontier)
+            step_info = dict(step_info, frontier_before=frontier_before, frontier_after=frontier_after)
+            if self.frontier_name:
+                step_info[f"{self.frontier_name}_before"] = frontier_before
+                step_info[f"{self.frontier_name}_after"] = frontier_after
+            yield closed_set.copy(), frontier_after, self.path_to(expanded_node), step_info
+
+    def _ordered(self, frontier) -> list:
+        """Return frontier entries in display order."""
+        if self.sort_key is None:
+            return list(frontier)
+        return sorted(frontier, key=self.sort_key)
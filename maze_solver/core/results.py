@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Tuple, List, Optional, Dict, Any
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Enhanced container for search algorithm results with educational metrics.
 
@@ -19,6 +19,11 @@ class SearchResult:
         exploration_history (List): History of algorithm state for visualization/analysis.
         node_discovery (Dict): Maps each node to the step when it was first discovered.
         node_expansion (Dict): Maps each node to the step when it was expanded.
+        node_h_value (Dict): Heuristic value of each node (informed searches with exploration).
+        node_g_value (Dict): Cost from the start to each node (informed searches with exploration).
+        node_f_value (Dict): Priority f-value of each node (informed searches with exploration).
+
+    Instances use ``__slots__``, so every metric a search reports must be declared here.
     """
     path: Optional[List[Tuple[int, int]]] = None  # Solution path from start to goal
     visited: List[Tuple[int, int]] = field(default_factory=list)  # List of visited nodes
@@ -30,6 +35,9 @@ class SearchResult:
     # Educational tracking metrics
     node_discovery: Dict[Tuple[int, int], int] = field(default_factory=dict)  # When each node was discovered
     node_expansion: Dict[Tuple[int, int], int] = field(default_factory=dict)  # When each node was expanded
+    node_h_value: Dict[Tuple[int, int], float] = field(default_factory=dict)  # Heuristic value of each node
+    node_g_value: Dict[Tuple[int, int], float] = field(default_factory=dict)  # Cost from start to each node
+    node_f_value: Dict[Tuple[int, int], float] = field(default_factory=dict)  # Priority of each node
 
     def __str__(self) -> str:
         """Enhanced string representation of results with educational metrics.
@@ -48,7 +56,7 @@ class SearchResult:
         Returns:
             A formatted string with performance metrics for successful searches.
         """
-        avg_branching = self._calculate_avg_branching_factor()
+        avg_branching = self.avg_branching_factor
 
         output = [
             f"✅ Search succeeded in {self.steps} steps ({self.execution_time:.3f}s)",
@@ -67,7 +75,7 @@ class SearchResult:
         Returns:
             A formatted string with performance metrics and possible failure reasons.
         """
-        avg_branching = self._calculate_avg_branching_factor()
+        avg_branching = self.avg_branching_factor
 
         output = [
             f"❌ Search failed after {self.steps} steps ({self.execution_time:.3f}s)",
@@ -82,8 +90,12 @@ class SearchResult:
 
         return "\n".join(output)
 
-    def _calculate_avg_branching_factor(self) -> float:
-        """Calculate the average branching factor during search.
+    @property
+    def avg_branching_factor(self) -> float:
+        """Average branching factor during search.
+
+        Derived from the sizes of node_discovery and node_expansion, so it is
+        O(1) to compute and always reflects the current metrics.
 
         Returns:
             The average number of new nodes discovered per expanded node,
@@ -99,6 +111,27 @@ class SearchResult:
 
         return discovered_count / expanded_count if expanded_count > 0 else 0.0
 
+    def path_at_step(self, step: int) -> Optional[List[Tuple[int, int]]]:
+        """Reconstruct the path to the node expanded at a given step.
+
+        Paths are not stored per step; they are rebuilt on request from the
+        parent pointers the exploration history keeps.
+
+        Args:
+            step: Search step number, as used in node_expansion (starting at 1).
+
+        Returns:
+            The path from the start to the node expanded at that step, or None if
+            no node was expanded at that step or no exploration history was recorded.
+        """
+        path_to = getattr(self.exploration_history, "path_to", None)
+        if path_to is None:
+            return None
+        for node, expanded_at in self.node_expansion.items():
+            if expanded_at == step:
+                return path_to(node)
+        return None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert results to dictionary for analysis with educational metrics.
 
@@ -113,7 +146,7 @@ class SearchResult:
             'visited_nodes': len(self.visited),
             'path_to_visited_ratio': (len(self.path) / len(self.visited)
                                      if self.path and len(self.visited) > 0 else None),
-            'avg_branching_factor': self._calculate_avg_branching_factor(),
+            'avg_branching_factor': self.avg_branching_factor,
             'discovery_to_expansion_ratio': (len(self.node_discovery) / len(self.node_expansion)
                                            if self.node_expansion else None),
             'nodes_per_step': len(self.visited) / self.steps if self.steps > 0 else 0
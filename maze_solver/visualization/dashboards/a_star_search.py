@@ -1,4 +1,4 @@
-from .base import SearchAlgorithmDashboard
+from .base import SearchAlgorithmDashboard, _VisitOrder, _format_node
 
 
 class AStarDashboard(SearchAlgorithmDashboard):
@@ -9,6 +9,7 @@ class AStarDashboard(SearchAlgorithmDashboard):
 
     def _extract_history_data(self):
         self.steps_data = []
+        visit_order = _VisitOrder(self.env.grid.size)
 
         for i, state in enumerate(self.result.exploration_history):
             closed_set, frontier, current_path, step_info = state
@@ -27,7 +28,7 @@ class AStarDashboard(SearchAlgorithmDashboard):
                 'frontier_after': step_info.get('frontier_after', []),
                 'frontier_nodes': frontier_nodes,
                 'frontier': frontier,
-                'visited': list(closed_set),
+                'visited': visit_order.view(closed_set, (step_info['expanded_node'],)),
                 'current_path': current_path,
                 'visited_count': len(closed_set),
                 'frontier_size': len(frontier)
@@ -36,13 +37,10 @@ class AStarDashboard(SearchAlgorithmDashboard):
     def _plot_algorithm_state(self, ax, step_data):
         ax.axis('off')
 
-        def format_node(node):
-            return f"({node[0]},{node[1]})"
-
         # Create main metrics table with f, g, h values
         table_data = [
             ["Step", str(step_data['step'])],
-            ["Expanded Node", format_node(step_data['expanded_node'])],
+            ["Expanded Node", _format_node(step_data['expanded_node'])],
             ["f = g + h", f"{step_data['expanded_node_f']:.2f}"],
             ["g (path cost)", f"{step_data['expanded_node_g']:.2f}"],
             ["h (heuristic)", f"{step_data['expanded_node_h']:.2f}"],
@@ -51,27 +49,8 @@ class AStarDashboard(SearchAlgorithmDashboard):
         ]
 
         # Draw main table
-        main_table = ax.table(
-            cellText=table_data,
-            colLabels=["Metric", "Value"],
-            colWidths=[0.3, 0.7],
-            loc='center',
-            cellLoc='center',
-            bbox=[0.1, 0.7, 0.8, 0.25]
-        )
-        main_table.auto_set_font_size(False)
-        main_table.set_fontsize(12)
-
-        # Style table
-        for i in range(len(table_data) + 1):
-            for j in range(2):
-                cell = main_table[i, j]
-                cell.set_edgecolor('black')
-                if i == 0:  # Header
-                    cell.set_facecolor('#4472C4')
-                    cell.set_text_props(color='white', fontweight='bold')
-                else:
-                    cell.set_facecolor('#D9E1F2' if i % 2 else '#E9EDF4')
+        self._draw_table(ax, table_data, ["Metric", "Value"], [0.3, 0.7], [0.1, 0.7, 0.8, 0.25],
+                         '#4472C4', ('#D9E1F2', '#E9EDF4'))
 
         # Draw priority queue visualization
         self._draw_frontier_table(ax, step_data)
@@ -90,9 +69,6 @@ class AStarDashboard(SearchAlgorithmDashboard):
 
     def _draw_frontier_table(self, ax, step_data):
         """Draw priority queue table with f, g, h values."""
-        def format_node(node):
-            return f"({node[0]},{node[1]})"
-
         # Draw priority queue
         ax.text(0.5, 0.55, "Priority Queue (sorted by f-value)", ha='center', va='center',
                 fontsize=14, fontweight='bold')
@@ -101,38 +77,16 @@ class AStarDashboard(SearchAlgorithmDashboard):
         if isinstance(step_data['frontier'], list) and step_data['frontier']:
             for i, (f, g, node) in enumerate(step_data['frontier']):
                 h = f - g  # Calculate h from f and g
-                queue_data.append([f"{i+1}", format_node(node), f"{f:.2f}", f"{g:.2f}", f"{h:.2f}"])
+                queue_data.append([f"{i+1}", _format_node(node), f"{f:.2f}", f"{g:.2f}", f"{h:.2f}"])
 
         if queue_data:
-            queue_table = ax.table(
-                cellText=queue_data,
-                colLabels=["Position", "Node", "f-value", "g-value", "h-value"],
-                colWidths=[0.1, 0.2, 0.15, 0.15, 0.15],
-                loc='center',
-                cellLoc='center',
-                bbox=[0.1, 0.3, 0.8, 0.2]
-            )
-            queue_table.auto_set_font_size(False)
-            queue_table.set_fontsize(12)
-
-            # Style table
-            for i in range(len(queue_data) + 1):
-                for j in range(5):
-                    cell = queue_table[i, j]
-                    cell.set_edgecolor('black')
-                    if i == 0:  # Header
-                        cell.set_facecolor('#70AD47')
-                        cell.set_text_props(color='white', fontweight='bold')
-                    else:
-                        cell.set_facecolor('#E2EFDA' if i % 2 else '#EAF5E0')
+            self._draw_table(ax, queue_data, ["Position", "Node", "f-value", "g-value", "h-value"], [0.1, 0.2, 0.15, 0.15, 0.15], [0.1, 0.3, 0.8, 0.2],
+                             '#70AD47', ('#E2EFDA', '#EAF5E0'), max_rows=self._max_frontier_rows)
         else:
             ax.text(0.5, 0.4, "Queue is empty", ha='center', va='center', fontsize=12, color='red')
 
     def _print_step_explanation(self, step_data):
-        def format_node(node):
-            return f"({node[0]},{node[1]})"
-
-        expanded_node = format_node(step_data['expanded_node'])
+        expanded_node = _format_node(step_data['expanded_node'])
         print(f"🔍 A* Search Step {step_data['step']} Explanation:")
         print(f"---------------------------")
         print(f"Currently expanding: {expanded_node} with f={step_data['expanded_node_f']:.2f} (g={step_data['expanded_node_g']:.2f}, h={step_data['expanded_node_h']:.2f})")
@@ -144,7 +98,7 @@ class AStarDashboard(SearchAlgorithmDashboard):
 
         if step_data['expanded_node'] != self.env.end:
             if isinstance(step_data['neighbors_added'], list) and step_data['neighbors_added']:
-                neighbors_text = ", ".join([f"{format_node(n)} (f={f:.2f}, g={g:.2f})" for f, g, n in step_data['neighbors_added']])
+                neighbors_text = ", ".join([f"{_format_node(n)} (f={f:.2f}, g={g:.2f})" for f, g, n in step_data['neighbors_added']])
                 print(f"\n2️⃣ Discovered neighbors with evaluation: {neighbors_text}")
                 print("   These neighbors were added to the priority queue sorted by f-value.")
             else:
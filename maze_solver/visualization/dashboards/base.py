@@ -1,25 +1,136 @@
 from abc import ABC, abstractmethod
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from functools import cached_property, lru_cache
+from itertools import repeat
 import numpy as np
-import networkx as nx
 import os
-import tempfile
-import imageio
 
-from ...core.environment import MazeEnvironment
+from ...core.environment import MazeEnvironment, _cell_indices
 from ...core.results import SearchResult
 
+# Node categories of the graph animation, in drawing order: later layers cover earlier ones
+_REGULAR, _VISITED, _FRONTIER, _PATH, _EXPANDED, _START, _END = range(7)
+_NODE_LAYERS = ('regular', 'visited', 'frontier', 'path', 'expanded', 'start', 'end')
+
+# matplotlib, networkx and imageio take about half a second to import, so they are
+# imported where they are used: building a dashboard and printing steps need none of them
+
+# Dashboard and per-animation arguments of a frame-rendering worker process
+_worker_state = None
+
+
+def _init_frame_worker(dashboard, shared_args):
+    """Store the state every frame rendered by this worker process needs."""
+    global _worker_state
+    _worker_state = (dashboard, shared_args)
+
+
+def _render_frame(method, *frame_args):
+    """Render one frame in a worker process with the dashboard it was initialized with."""
+    dashboard, shared_args = _worker_state
+    return getattr(dashboard, method)(*shared_args, *frame_args)
+
+
+class _VisitOrder:
+    """Nodes in the order a search first visited them, stored once for all of its steps.
+
+    A search's visited set only grows, so the nodes visited by any step are the
+    first len(visited) rows of one (cells, 2) array of rows and columns. Steps
+    hold read-only views of those rows instead of their own lists of nodes.
+    """
+
+    def __init__(self, capacity):
+        """Initialize an empty order with room for capacity nodes (the maze's cell count)."""
+        self._cells = np.empty((capacity, 2), dtype=np.int32)
+        self._seen = set()
+
+    def view(self, visited, added=()):
+        """Record the nodes of visited not seen before and return all of visited as an (N, 2) array.
+
+        Args:
+            visited: The visited nodes of the next step, a superset of the previous step's.
+            added: Nodes that may have joined visited since the previous step. When
+                they account for all of its growth, only they are looked up rather
+                than every node of visited, so a whole search is recorded in linear
+                time. Otherwise visited is compared with the nodes seen so far.
+
+        Returns:
+            A read-only view of the first len(visited) rows, or a copy of visited
+            if it does not contain every node seen so far.
+        """
+        seen = self._seen
+        new = [node for node in dict.fromkeys(added) if node not in seen and node in visited]
+        if len(seen) + len(new) != len(visited):
+            new = set(visited) - seen
+            if len(seen) + len(new) != len(visited):
+                return np.array(list(visited), dtype=np.int32).reshape(-1, 2)
+        count = len(seen) + len(new)
+        if new:
+            self._cells[len(seen):count] = list(new)
+            seen.update(new)
+        rows = self._cells[:count]
+        rows.flags.writeable = False
+        return rows
+
+
+@lru_cache(maxsize=None)
+def _format_node(node):
+    """Format a (row, col) node as "(row,col)", once per distinct node."""
+    return f"({node[0]},{node[1]})"
+
+
+@lru_cache(maxsize=None)
+def _maze_colormap():
+    """Return the colormap and norm of the maze plot's cell values, built on first use."""
+    from matplotlib.colors import BoundaryNorm, ListedColormap
+
+    # Colors of the cell values, with a bin centered on each value
+    cmap = ListedColormap([
+        'black',     # 0: Wall
+        'yellow',    # 1: Visited
+        'green',     # 2: Current path
+        'blue',      # 3: Start
+        'purple',    # 4: Goal
+        'white',     # 5: Unvisited path
+        'lightblue', # 6: Frontier
+        'red'        # 7: Currently expanded node
+    ])
+    return cmap, BoundaryNorm([-0.5, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5], cmap.N)
+
+
+def _figure_image(fig):
+    """Render fig with Agg and return its pixels as an (H, W, 4) uint8 RGBA array."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())
+
+
 class SearchAlgorithmDashboard(ABC):
     """Abstract base class for search algorithm educational dashboards."""
 
+    # Frontier tables longer than this end in a "..." row counting the rest
+    _max_frontier_rows = 6
+
     def __init__(self, env: MazeEnvironment, result: SearchResult):
         """Initialize the educational dashboard with search results."""
         self.env = env
         self.result = result
         self.algorithm_name = self.__class__.__name__.replace("Dashboard", "")
         self.steps_data = []
+        self._step_canvases = {}  # Reusable animation frame canvases by dpi
+        self._graph_canvases = {}  # Reusable graph animation frame canvases by size
         self._extract_history_data()
 
+    def __getstate__(self):
+        """Pickle the dashboard without its frame canvases; each process builds its own."""
+        state = self.__dict__.copy()
+        state['_step_canvases'] = {}
+        state['_graph_canvases'] = {}
+        return state
+
     @abstractmethod
     def _extract_history_data(self):
         """Process exploration history into data for visualization."""
@@ -32,46 +143,165 @@ class SearchAlgorithmDashboard(ABC):
 
     def create_maze_graph(self):
         """Create a NetworkX graph from maze data."""
+        import networkx as nx
+
         G = nx.Graph()
+        is_path = self.env.grid == 0  # Not a wall
+
+        # Add nodes for all valid positions, in row-major order
+        rows, cols = np.nonzero(is_path)
+        G.add_nodes_from(zip(rows.tolist(), cols.tolist()))
 
-        # Add nodes for all valid positions
-        for r in range(self.env.grid.shape[0]):
-            for c in range(self.env.grid.shape[1]):
-                if self.env.grid[r, c] == 0:  # If not a wall
-                    G.add_node((r, c))
-
-        # Add edges between adjacent nodes
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        for node in G.nodes():
-            r, c = node
-            for dr, dc in directions:
-                neighbor = (r + dr, c + dc)
-                if neighbor in G:  # If neighbor exists in graph
-                    G.add_edge(node, neighbor)
+        # Add edges between horizontally and vertically adjacent nodes
+        for (dr, dc), links in (((0, 1), is_path[:, :-1] & is_path[:, 1:]),
+                                ((1, 0), is_path[:-1, :] & is_path[1:, :])):
+            rows, cols = np.nonzero(links)
+            G.add_edges_from(zip(zip(rows.tolist(), cols.tolist()),
+                                 zip((rows + dr).tolist(), (cols + dc).tolist())))
 
         return G
 
-    def _plot_maze(self, ax, step_data):
-        """Plot the maze with current path and visited nodes."""
-        rows, cols = self.env.grid.shape
-        viz_grid = np.ones((rows, cols)) * 5  # Initialize with unvisited path value
+    @cached_property
+    def maze_graph(self):
+        """NetworkX graph of the maze, built on first use and reused by later animations."""
+        return self.create_maze_graph()
+
+    @cached_property
+    def layout_pos(self):
+        """Drawing position (x, y) of each maze_graph node, with rows running downwards."""
+        return {node: (node[1], -node[0]) for node in self.maze_graph.nodes()}
+
+    @cached_property
+    def node_labels(self):
+        """"row,col" label of each maze_graph node."""
+        return {node: f"{node[0]},{node[1]}" for node in self.maze_graph.nodes()}
+
+    @cached_property
+    def _legend_elements(self):
+        """Legend handles of the maze plot, shared by every frame."""
+        from matplotlib.patches import Rectangle
+
+        return [
+            Rectangle((0,0), 1, 1, color='white', label='Path'),
+            Rectangle((0,0), 1, 1, color='yellow', label='Visited'),
+            Rectangle((0,0), 1, 1, color='lightblue', label=self.get_frontier_name()),
+            Rectangle((0,0), 1, 1, color='red', label='Current Node'),
+            Rectangle((0,0), 1, 1, color='green', label='Current Path'),
+            Rectangle((0,0), 1, 1, color='blue', label='Start'),
+            Rectangle((0,0), 1, 1, color='purple', label='Goal'),
+            Rectangle((0,0), 1, 1, color='black', label='Wall')
+        ]
+
+    @staticmethod
+    def _edge_segments(edges, pos):
+        """Return the edges as an (E, 2, 2) array of [(x0, y0), (x1, y1)] line segments."""
+        return np.array([(pos[u], pos[v]) for u, v in edges], dtype=float).reshape(-1, 2, 2)
+
+    @staticmethod
+    def _edge_collection(segments, width, color='k', alpha=None):
+        """Create a LineCollection styled like nx.draw_networkx_edges (drawn behind nodes)."""
+        from matplotlib.collections import LineCollection
+
+        return LineCollection(segments, linewidths=width, colors=color, alpha=alpha, zorder=1)
+
+    @staticmethod
+    def _draw_edges(ax, collection, segments):
+        """Add a copy of a prebuilt edge collection to ax.
+
+        Building a LineCollection creates one Path per edge, so the collection of
+        all graph edges is built once and copied into each frame. The data limits
+        are padded from the segments as nx.draw_networkx_edges pads them.
+        """
+        ax.add_collection(copy(collection), autolim=False)
+        if len(segments):
+            points = segments.reshape(-1, 2)
+            low, high = points.min(axis=0), points.max(axis=0)
+            padding = 0.05 * (high - low)
+            ax.update_datalim([low - padding, high + padding])
+            ax.autoscale_view()
+
+    @staticmethod
+    def _node_indices(node_index, nodes):
+        """Return the positions of nodes in the graph's node order, as an index array.
+
+        node_index holds the position of the node at each maze cell, so nodes may be
+        a collection of (row, col) tuples or an (N, 2) array.
+        """
+        return node_index[_cell_indices(nodes)]
+
+    @staticmethod
+    def _draw_nodes(ax, node_xy, categories, palette, node_size):
+        """Draw every node with a single scatter call, colored by its category.
+
+        Nodes are drawn sorted by category, so each layer covers the ones before
+        it just as separate nx.draw_networkx_nodes calls per category would.
+        """
+        order = np.argsort(categories, kind='stable')
+        ax.scatter(node_xy[order, 0], node_xy[order, 1], s=node_size,
+                   c=palette[categories[order]], zorder=2)
+
+    def _sample_steps(self, max_frames):
+        """Return at most max_frames entries of steps_data, evenly spaced.
+
+        The samples run from the first step to the last, and the final solution
+        frame is still added after them. A max_frames of None or 0 keeps every step.
+
+        Args:
+            max_frames: Maximum number of step frames in an animation.
+
+        Returns:
+            The steps to render, in order.
+        """
+        if not max_frames or len(self.steps_data) <= max_frames:
+            return self.steps_data
+        indices = np.linspace(0, len(self.steps_data) - 1, max_frames).astype(int)
+        return [self.steps_data[i] for i in indices]
+
+    def _render_frames(self, method, frame_args, shared_args=(), max_workers=None):
+        """Render frames by calling a frame method once per argument tuple, across processes.
+
+        Every frame is an independent figure, so frames are rendered in a
+        ProcessPoolExecutor. The dashboard and shared_args are sent to each worker
+        once, and only the per-frame arguments travel with each frame. With a
+        single worker or frame, frames are rendered in this process.
+
+        Args:
+            method: Name of the dashboard method that renders one frame and returns its image.
+            frame_args: One tuple of per-frame arguments for each frame.
+            shared_args: Arguments passed before the per-frame ones to every call.
+            max_workers: Number of worker processes. Defaults to the CPU count.
+
+        Yields:
+            The frame images, in order, as they become available.
+        """
+        max_workers = min(max_workers or os.cpu_count() or 1, len(frame_args))
+        if max_workers <= 1:
+            for args in frame_args:
+                yield getattr(self, method)(*shared_args, *args)
+            return
+
+        chunksize = max(1, len(frame_args) // (4 * max_workers))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_frame_worker,
+                                 initargs=(self, shared_args)) as executor:
+            yield from executor.map(_render_frame, repeat(method), *zip(*frame_args), chunksize=chunksize)
+
+    def _maze_grid(self, step_data):
+        """Return the maze plot's cell values for a step (see _maze_colormap)."""
+        grid = self.env.grid
+        viz_grid = np.full(grid.shape, 5, dtype=np.uint8)  # Initialize with unvisited path value
 
         # Fill in walls
-        viz_grid[self.env.grid == 1] = 0  # Walls
+        viz_grid[grid == 1] = 0  # Walls
 
-        # Fill in visited paths
-        for pos in step_data['visited']:
-            r, c = pos
-            if self.env.grid[r, c] == 0:  # Only if it's a path
-                viz_grid[r, c] = 1  # Visited paths
+        # Fill in visited paths; start, end and later layers overwrite their cells below
+        rows, cols = _cell_indices(step_data['visited'])
+        is_path = grid[rows, cols] == 0  # Only if it's a path
+        viz_grid[rows[is_path], cols[is_path]] = 1  # Visited paths
 
         # Fill in current frontier
         # Use frontier_nodes if available (for informed search), otherwise use frontier
         frontier_to_plot = step_data.get('frontier_nodes', step_data['frontier'])
-        for pos in frontier_to_plot:
-            r, c = pos
-            if pos != self.env.start and pos != self.env.end:
-                viz_grid[r, c] = 6  # Frontier nodes
+        viz_grid[_cell_indices(frontier_to_plot)] = 6  # Frontier nodes
 
         # Fill in expanded node
         if step_data['expanded_node'] != self.env.start and step_data['expanded_node'] != self.env.end:
@@ -80,47 +310,74 @@ class SearchAlgorithmDashboard(ABC):
 
         # Fill in current path
         if step_data['current_path']:
-            for pos in step_data['current_path']:
-                if pos != self.env.start and pos != self.env.end:
-                    r, c = pos
-                    viz_grid[r, c] = 2  # Current path
+            viz_grid[_cell_indices(step_data['current_path'])] = 2  # Current path
 
         # Mark start and end
         viz_grid[self.env.start] = 3  # Start
         viz_grid[self.env.end] = 4    # Goal
 
-        # Define colors with enhanced palette
-        cmap = plt.cm.colors.ListedColormap([
-            'black',     # 0: Wall
-            'yellow',    # 1: Visited
-            'green',     # 2: Current path
-            'blue',      # 3: Start
-            'purple',    # 4: Goal
-            'white',     # 5: Unvisited path
-            'lightblue', # 6: Frontier
-            'red'        # 7: Currently expanded node
-        ])
-        bounds = [-0.5, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5]
-        norm = plt.cm.colors.BoundaryNorm(bounds, cmap.N)
-
-        # Plot the maze
-        ax.imshow(viz_grid, cmap=cmap, norm=norm)
-        ax.set_title(f"{self.algorithm_name} Search - Step {step_data['step']}")
+        return viz_grid
+
+    def _plot_maze(self, ax, step_data):
+        """Plot the maze with current path and visited nodes.
+
+        The maze is a single image, which _update_maze fills in with set_data,
+        so animation frames drawn on a reused figure update it in place.
+        """
+        cmap, norm = _maze_colormap()
+        ax.imshow(np.zeros(self.env.grid.shape, dtype=np.uint8), cmap=cmap, norm=norm)
         ax.set_xticks([])
         ax.set_yticks([])
 
         # Add legend
-        legend_elements = [
-            plt.Rectangle((0,0), 1, 1, color='white', label='Path'),
-            plt.Rectangle((0,0), 1, 1, color='yellow', label='Visited'),
-            plt.Rectangle((0,0), 1, 1, color='lightblue', label=self.get_frontier_name()),
-            plt.Rectangle((0,0), 1, 1, color='red', label='Current Node'),
-            plt.Rectangle((0,0), 1, 1, color='green', label='Current Path'),
-            plt.Rectangle((0,0), 1, 1, color='blue', label='Start'),
-            plt.Rectangle((0,0), 1, 1, color='purple', label='Goal'),
-            plt.Rectangle((0,0), 1, 1, color='black', label='Wall')
-        ]
-        ax.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, -0.05), ncol=3)
+        ax.legend(handles=self._legend_elements, loc='upper center', bbox_to_anchor=(0.5, -0.05), ncol=3)
+
+        self._update_maze(ax, step_data)
+
+    def _update_maze(self, ax, step_data):
+        """Show another step on a maze plot drawn by _plot_maze."""
+        ax.images[0].set_data(self._maze_grid(step_data))
+        ax.set_title(f"{self.algorithm_name} Search - Step {step_data['step']}")
+
+    @staticmethod
+    def _draw_table(ax, rows, col_labels, col_widths, bbox, header_color, row_colors, max_rows=None):
+        """Draw a table with a white bold header on header_color and alternating row colors.
+
+        Cell colors are passed to ax.table in bulk rather than set cell by cell.
+
+        Args:
+            ax: Axes to draw on.
+            rows: Table body, one list of cell texts per row.
+            col_labels: Header text of each column.
+            col_widths: Width of each column, as a fraction of the axes width.
+            bbox: Table bounds [left, bottom, width, height] in axes coordinates.
+            header_color: Background color of the header row.
+            row_colors: Background colors of the first body row and of the one after it.
+            max_rows: Optional number of body rows to show; the rest are replaced by a
+                "..." row counting them.
+
+        Returns:
+            The matplotlib Table.
+        """
+        if max_rows is not None and len(rows) > max_rows:
+            more = ["...", f"+{len(rows) - max_rows} more"] + [""] * (len(col_labels) - 2)
+            rows = rows[:max_rows] + [more]
+
+        table = ax.table(
+            cellText=rows,
+            cellColours=[[row_colors[i % 2]] * len(col_labels) for i in range(len(rows))],
+            colLabels=col_labels,
+            colColours=[header_color] * len(col_labels),
+            colWidths=col_widths,
+            loc='center',
+            cellLoc='center',
+            bbox=bbox
+        )
+        table.auto_set_font_size(False)
+        table.set_fontsize(12)
+        for j in range(len(col_labels)):
+            table[0, j].set_text_props(color='white', fontweight='bold')
+        return table
 
     @abstractmethod
     def _plot_algorithm_state(self, ax, step_data):
@@ -138,6 +395,8 @@ class SearchAlgorithmDashboard(ABC):
             print("Invalid step index")
             return
 
+        import matplotlib.pyplot as plt
+
         step_data = self.steps_data[step_idx]
         fig = plt.figure(figsize=(18, 8))
 
@@ -152,19 +411,36 @@ class SearchAlgorithmDashboard(ABC):
 
         self._print_step_explanation(step_data)
 
-    def animate_on_graph(self, output_file=None, fps=1, size=5):
-        """Animate algorithm on graph representation."""
+    def animate_on_graph(self, output_file=None, fps=1, size=5, max_workers=None, format="gif",
+                         show_labels=False, max_frames=200):
+        """Animate algorithm on graph representation.
+
+        Frames are rendered in parallel by up to max_workers processes (default:
+        the CPU count). format is "gif" or "mp4" (see _write_animation). With
+        show_labels, each frame labels the nodes of its current path, its
+        expanded node, the start and the goal with their "row,col" coordinates.
+        Searches longer than max_frames steps are sampled (see _sample_steps).
+        """
         if output_file is None:
-            output_file = f"{self.algorithm_name.lower()}_graph.gif"
+            output_file = f"{self.algorithm_name.lower()}_graph.{format}"
 
         try:
-            G = self.create_maze_graph()
-            pos = {node: (node[1], -node[0]) for node in G.nodes()}
+            from matplotlib.colors import to_rgba_array
+
+            G = self.maze_graph
+            pos = self.layout_pos
 
             node_size = 300
             edge_width = 1
             path_edge_width = 3
 
+            edge_segments = self._edge_segments(G.edges(), pos)
+            edges = self._edge_collection(edge_segments, edge_width, alpha=0.5)
+
+            node_index = np.full(self.env.grid.shape, -1, dtype=np.intp)
+            node_index[_cell_indices(list(G.nodes()))] = np.arange(G.number_of_nodes())
+            node_xy = np.array([pos[node] for node in G.nodes()], dtype=float).reshape(-1, 2)
+
             colors = {
                 'regular': 'lightgray',
                 'visited': 'yellow',
@@ -175,245 +451,291 @@ class SearchAlgorithmDashboard(ABC):
                 'expanded': 'red'
             }
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                frame_files = []
+            palette = to_rgba_array([colors[layer] for layer in _NODE_LAYERS])
 
+            def frames():
                 # Create frames for each step
-                for i, step_data in enumerate(self.steps_data):
-                    plt.figure(figsize=(size, size))
-
-                    # Draw base graph elements and all nodes
-                    nx.draw_networkx_nodes(G, pos, node_color=colors['regular'], node_size=node_size)
-
-                    # Draw visited nodes
-                    visited_only = [n for n in step_data['visited']
-                                if n not in step_data['frontier']
-                                and (not step_data['current_path'] or n not in step_data['current_path'])
-                                and n != self.env.start
-                                and n != self.env.end
-                                and n != step_data['expanded_node']]
-                    if visited_only:
-                        nx.draw_networkx_nodes(G, pos, nodelist=visited_only,
-                                            node_color=colors['visited'], node_size=node_size)
-
-                    # Draw frontier nodes - use frontier_nodes if available
-                    frontier_to_plot = step_data.get('frontier_nodes', step_data['frontier'])
-                    frontier_only = [n for n in frontier_to_plot
-                                if (not step_data['current_path'] or n not in step_data['current_path'])
-                                and n != self.env.start
-                                and n != self.env.end
-                                and n != step_data['expanded_node']]
-                    if frontier_only:
-                        nx.draw_networkx_nodes(G, pos, nodelist=frontier_only,
-                                            node_color=colors['frontier'], node_size=node_size)
-
-                    # Draw current path
-                    if step_data['current_path']:
-                        path_only = [n for n in step_data['current_path']
-                                    if n != self.env.start
-                                    and n != self.env.end
-                                    and n != step_data['expanded_node']]
-                        if path_only:
-                            nx.draw_networkx_nodes(G, pos, nodelist=path_only,
-                                                node_color=colors['path'], node_size=node_size)
-
-                        path_edges = list(zip(step_data['current_path'][:-1], step_data['current_path'][1:]))
-                        nx.draw_networkx_edges(G, pos, edgelist=path_edges,
-                                            width=path_edge_width, edge_color=colors['path'])
-
-                    # Draw special nodes
-                    nx.draw_networkx_nodes(G, pos, nodelist=[step_data['expanded_node']],
-                                        node_color=colors['expanded'], node_size=node_size)
-
-                    nx.draw_networkx_nodes(G, pos, nodelist=[self.env.start],
-                                        node_color=colors['start'], node_size=node_size)
-                    nx.draw_networkx_nodes(G, pos, nodelist=[self.env.end],
-                                        node_color=colors['end'], node_size=node_size)
-
-                    # Draw all edges
-                    nx.draw_networkx_edges(G, pos, width=edge_width, alpha=0.5)
-
-                    # Add labels
-                    nx.draw_networkx_labels(G, pos, labels={node: f"{node[0]},{node[1]}" for node in G.nodes()})
-
-                    plt.title(f"{self.algorithm_name} Graph Traversal - Step {step_data['step']} / {len(self.steps_data)}")
-                    plt.axis('off')
-
-                    frame_file = os.path.join(temp_dir, f"frame_{i:03d}.png")
-                    plt.savefig(frame_file)
-                    frame_files.append(frame_file)
-                    plt.close()
+                yield from self._render_frames(
+                    '_render_graph_frame', [(step_data,) for step_data in self._sample_steps(max_frames)],
+                    shared_args=(G, pos, colors, node_index, node_xy, palette, edges, edge_segments,
+                                 node_size, path_edge_width, size, show_labels),
+                    max_workers=max_workers
+                )
 
                 # Add final frame if search was successful
                 if self.result.success and self.result.path:
-                    self._create_final_frame(G, pos, colors, edge_width, path_edge_width, temp_dir, frame_files)
+                    yield self._create_final_frame(G, pos, colors, node_index, node_xy, palette, edges,
+                                                   edge_segments, path_edge_width, size, show_labels)
 
-                # Create GIF
-                with imageio.get_writer(output_file, mode='I', fps=fps) as writer:
-                    for frame_file in frame_files:
-                        image = imageio.imread(frame_file)
-                        writer.append_data(image)
+            self._write_animation(frames(), output_file, fps, format)
 
-                print(f"Graph animation saved to {output_file}")
+            print(f"Graph animation saved to {output_file}")
 
         except Exception as e:
             print(f"Error in {self.algorithm_name} graph animation: {e}")
 
-    def _create_final_frame(self, G, pos, colors, edge_width, path_edge_width, temp_dir, frame_files):
-        """Create final frame showing complete solution."""
-        plt.figure(figsize=(6, 6))
-
-        # Draw regular nodes
-        nx.draw_networkx_nodes(G, pos, node_color=colors['regular'], node_size=300)
-
-        # Draw visited nodes
-        visited_only = [n for n in self.result.visited
-                    if n not in self.result.path
-                    and n != self.env.start
-                    and n != self.env.end]
-        if visited_only:
-            nx.draw_networkx_nodes(G, pos, nodelist=visited_only,
-                                node_color=colors['visited'], node_size=300)
-
-        # Draw path nodes
-        path_only = [n for n in self.result.path
-                    if n != self.env.start
-                    and n != self.env.end]
-        if path_only:
-            nx.draw_networkx_nodes(G, pos, nodelist=path_only,
-                                node_color=colors['path'], node_size=300)
-
-        # Draw start and end
-        nx.draw_networkx_nodes(G, pos, nodelist=[self.env.start],
-                            node_color=colors['start'], node_size=300)
-        nx.draw_networkx_nodes(G, pos, nodelist=[self.env.end],
-                            node_color=colors['end'], node_size=300)
+    def _render_graph_frame(self, G, pos, colors, node_index, node_xy, palette, edges, edge_segments,
+                            node_size, path_edge_width, size, show_labels, step_data):
+        """Render one step of the graph animation and return it as an RGBA image.
+
+        Uses a standalone Figure rather than pyplot, so worker processes keep no
+        figure state. Each process draws its frames on one figure per size, built
+        for its first frame; later frames remove the previous step's nodes, edges
+        and labels and redraw them, so the axes and canvas renderer carry over.
+        """
+        canvas = self._graph_canvases.get(size)
+        if canvas is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            canvas = self._graph_canvases[size] = FigureCanvasAgg(Figure(figsize=(size, size)))
+            ax = canvas.figure.add_subplot()
+        else:
+            ax, = canvas.figure.axes
+            for artist in [*ax.collections, *ax.texts]:
+                artist.remove()
+
+        # Color each node by the topmost layer it belongs to
+        categories = np.full(len(node_xy), _REGULAR, dtype=np.uint8)
+        categories[self._node_indices(node_index, step_data['visited'])] = _VISITED
+        # Use frontier_nodes if available
+        frontier_to_plot = step_data.get('frontier_nodes', step_data['frontier'])
+        categories[self._node_indices(node_index, frontier_to_plot)] = _FRONTIER
+        if step_data['current_path']:
+            categories[self._node_indices(node_index, step_data['current_path'])] = _PATH
+        categories[node_index[step_data['expanded_node']]] = _EXPANDED
+        categories[node_index[self.env.start]] = _START
+        categories[node_index[self.env.end]] = _END
+        self._draw_nodes(ax, node_xy, categories, palette, node_size)
+
+        # Draw current path
+        if step_data['current_path']:
+            path_edges = zip(step_data['current_path'][:-1], step_data['current_path'][1:])
+            ax.add_collection(self._edge_collection(self._edge_segments(path_edges, pos),
+                                                    path_edge_width, colors['path']),
+                              autolim=False)
 
         # Draw all edges
-        nx.draw_networkx_edges(G, pos, width=edge_width, alpha=0.5)
+        self._draw_edges(ax, edges, edge_segments)
+
+        # Label the nodes the step is about
+        if show_labels:
+            self._draw_node_labels(ax, G, pos, [*(step_data['current_path'] or ()), step_data['expanded_node'],
+                                                self.env.start, self.env.end])
+
+        ax.set_title(f"{self.algorithm_name} Graph Traversal - Step {step_data['step']} / {len(self.steps_data)}")
+        ax.axis('off')
+
+        canvas.draw()
+        # The canvas buffer is redrawn by the next frame, so return a copy
+        return np.array(canvas.buffer_rgba())
+
+    def _create_final_frame(self, G, pos, colors, node_index, node_xy, palette, edges,
+                            edge_segments, path_edge_width, size, show_labels):
+        """Create final frame showing complete solution, the same size as the step frames."""
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(size, size))
+        ax = fig.add_subplot()
+
+        # Color each node by the topmost layer it belongs to
+        categories = np.full(len(node_xy), _REGULAR, dtype=np.uint8)
+        categories[self._node_indices(node_index, self.result.visited)] = _VISITED
+        categories[self._node_indices(node_index, self.result.path)] = _PATH
+        categories[node_index[self.env.start]] = _START
+        categories[node_index[self.env.end]] = _END
+        self._draw_nodes(ax, node_xy, categories, palette, 300)
+
+        # Draw all edges
+        self._draw_edges(ax, edges, edge_segments)
 
         # Highlight path edges
         if self.result.path:
-            path_edges = list(zip(self.result.path[:-1], self.result.path[1:]))
-            nx.draw_networkx_edges(G, pos, edgelist=path_edges,
-                                width=path_edge_width, edge_color=colors['path'])
+            path_edges = zip(self.result.path[:-1], self.result.path[1:])
+            ax.add_collection(self._edge_collection(self._edge_segments(path_edges, pos),
+                                                    path_edge_width, colors['path']),
+                              autolim=False)
 
-        # Add labels
-        nx.draw_networkx_labels(G, pos, labels={node: f"{node[0]},{node[1]}" for node in G.nodes()})
+        # Label the solution path
+        if show_labels:
+            self._draw_node_labels(ax, G, pos, [*(self.result.path or ()), self.env.start, self.env.end])
 
-        plt.title(f"{self.algorithm_name} Graph Traversal - Final Path ({len(self.result.path)-1 if self.result.path else 0} steps)")
-        plt.axis('off')
+        ax.set_title(f"{self.algorithm_name} Graph Traversal - Final Path ({len(self.result.path)-1 if self.result.path else 0} steps)")
+        ax.axis('off')
 
-        frame_file = os.path.join(temp_dir, "frame_final.png")
-        plt.savefig(frame_file)
-        frame_files.append(frame_file)
-        plt.close()
+        return _figure_image(fig)
 
-    def create_gif(self, filename=None, fps=1, dpi=100):
-        """Create a GIF animation from algorithm steps."""
-        if filename is None:
-            filename = f"{self.algorithm_name.lower()}_animation.gif"
+    def _draw_node_labels(self, ax, G, pos, nodes):
+        """Label nodes with their "row,col" coordinates.
 
-        print(f"Creating GIF with {len(self.steps_data)} frames...")
+        Every label is a separate Text artist, so only the nodes a frame is
+        about are labeled rather than the whole graph.
+        """
+        import networkx as nx
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            frame_files = []
-            # Create frames for each exploration step
-            for i, step_data in enumerate(self.steps_data):
-                fig = plt.figure(figsize=(18, 8))
+        nx.draw_networkx_labels(G, pos, labels={node: self.node_labels[node] for node in nodes}, ax=ax)
 
-                ax1 = plt.subplot2grid((1, 2), (0, 0))
-                self._plot_maze(ax1, step_data)
+    def _step_figure(self, dpi, step_data):
+        """Build the dashboard figure of one step: the maze and the algorithm state side by side.
 
-                ax2 = plt.subplot2grid((1, 2), (0, 1))
-                self._plot_algorithm_state(ax2, step_data)
+        Uses a standalone Figure rather than pyplot, so worker processes keep no figure state.
+        """
+        from matplotlib.figure import Figure
 
-                plt.tight_layout()
+        fig = Figure(figsize=(18, 8), dpi=dpi)
 
-                frame_file = os.path.join(temp_dir, f"frame_{i:03d}.png")
-                plt.savefig(frame_file, dpi=dpi)
-                frame_files.append(frame_file)
-                plt.close(fig)
+        ax1 = fig.add_subplot(1, 2, 1)
+        self._plot_maze(ax1, step_data)
+
+        ax2 = fig.add_subplot(1, 2, 2)
+        self._plot_algorithm_state(ax2, step_data)
+
+        return fig
+
+    def _step_layout(self, dpi, step_data):
+        """Return the subplot parameters tight_layout gives the dashboard figure of a step.
+
+        The maze keeps its shape and the state tables sit inside their axes, so
+        every step of an animation gets the same layout. It is computed once and
+        applied to each frame rather than rerun per frame.
+        """
+        fig = self._step_figure(dpi, step_data)
+        fig.tight_layout()
+        params = fig.subplotpars
+        return dict(left=params.left, right=params.right, bottom=params.bottom, top=params.top,
+                    wspace=params.wspace, hspace=params.hspace)
+
+    def _render_step_frame(self, dpi, layout, step_data):
+        """Render one step of the dashboard animation with the given layout, as an RGBA image.
+
+        Each process draws its frames on one figure per dpi, built for its first
+        frame. Later frames update the maze image in place and redraw only the
+        algorithm state, so the axes, legend and canvas renderer (with its
+        cached text layouts) carry over from frame to frame.
+        """
+        canvas = self._step_canvases.get(dpi)
+        if canvas is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+            canvas = self._step_canvases[dpi] = FigureCanvasAgg(self._step_figure(dpi, step_data))
+        else:
+            maze_ax, state_ax = canvas.figure.axes
+            self._update_maze(maze_ax, step_data)
+            for artist in [*state_ax.tables, *state_ax.texts, *state_ax.patches, *state_ax.lines,
+                           *state_ax.collections, *state_ax.images]:
+                artist.remove()
+            self._plot_algorithm_state(state_ax, step_data)
+
+        canvas.figure.subplots_adjust(**layout)
+        canvas.draw()
+        # The canvas buffer is redrawn by the next frame, so return a copy
+        return np.array(canvas.buffer_rgba())
+
+    def _write_animation(self, frames, output_file, fps, format="gif"):
+        """Encode frame images, in order, into output_file.
+
+        Frames are appended as they are produced, so they never touch the disk and
+        only those not yet encoded are held in memory.
+
+        Args:
+            frames: Iterable of RGBA frame images. For "mp4" they must all have the same size.
+            output_file: Path of the animation to write.
+            fps: Frames per second.
+            format: "gif", or "mp4" for an H.264 video. Videos encode faster and come out
+                several times smaller for long searches, but need the optional
+                imageio-ffmpeg package.
+        """
+        import imageio
+
+        if format == "mp4":
+            # Even frame sizes are all libx264 needs; the default block size of 16 would rescale frames
+            writer = imageio.get_writer(output_file, fps=fps, codec="libx264", macro_block_size=2)
+        elif format == "gif":
+            writer = imageio.get_writer(output_file, mode='I', fps=fps)
+        else:
+            raise ValueError(f"Unsupported animation format: {format!r} (expected 'gif' or 'mp4')")
+
+        with writer:
+            for image in frames:
+                writer.append_data(image)
+
+    def _create_solution_frame(self, dpi):
+        """Create the final dashboard frame showing the complete solution, as an RGBA image."""
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(18, 8), dpi=dpi)
+
+        # Left side: maze with complete solution path
+        ax1 = fig.add_subplot(1, 2, 1)
+
+        # Create a mock step_data for the final state
+        final_step_data = {
+            'step': self.steps_data[-1]['step'] + 1 if self.steps_data else 1,
+            'expanded_node': self.env.end,
+            'neighbors_added': [],
+            'frontier_before': [],
+            'frontier_after': [],
+            'frontier': [],
+            'visited': self.result.visited,
+            'current_path': self.result.path,
+            'visited_count': len(self.result.visited),
+            'frontier_size': 0
+        }
+
+        self._plot_maze(ax1, final_step_data)
+        ax1.set_title(f"{self.algorithm_name} Search - Final Solution")
+
+        # Right side: solution metrics
+        ax2 = fig.add_subplot(1, 2, 2)
+        ax2.axis('off')
+
+        # Create solution summary table
+        table_data = [
+            ["Total Steps", str(self.result.steps)],
+            ["Path Length", str(len(self.result.path))],
+            ["Visited Nodes", str(len(self.result.visited))],
+            ["Execution Time", f"{self.result.execution_time:.3f}s"],
+            ["Efficiency", f"{len(self.result.path)/len(self.result.visited)*100:.1f}%"]
+        ]
+
+        self._draw_table(ax2, table_data, ["Metric", "Value"], [0.3, 0.7], [0.1, 0.4, 0.8, 0.5],
+                         '#4472C4', ('#D9E1F2', '#E9EDF4'))
+
+        # Add completion message
+        ax2.text(0.5, 0.8, "SEARCH COMPLETED", ha='center', va='center',
+                fontsize=18, fontweight='bold', color='green')
+        ax2.text(0.5, 0.2, f"Solution path found with {len(self.result.path)-1} steps",
+                ha='center', va='center', fontsize=14)
+
+        fig.tight_layout()
+        return _figure_image(fig)
+
+    def create_gif(self, filename=None, fps=1, dpi=72, max_workers=None, format="gif", max_frames=200):
+        """Create a GIF animation from algorithm steps.
+
+        Frames are rendered in parallel by up to max_workers processes (default:
+        the CPU count). format is "gif" or "mp4" (see _write_animation).
+        Searches longer than max_frames steps are sampled (see _sample_steps).
+        """
+        if filename is None:
+            filename = f"{self.algorithm_name.lower()}_animation.{format}"
+
+        steps_data = self._sample_steps(max_frames)
+        print(f"Creating {format.upper()} with {len(steps_data)} frames...")
+
+        def frames():
+            # Create frames for each exploration step
+            if steps_data:
+                layout = self._step_layout(dpi, steps_data[0])
+                yield from self._render_frames('_render_step_frame', [(step_data,) for step_data in steps_data],
+                                               shared_args=(dpi, layout), max_workers=max_workers)
 
             # Add final solution frame if search was successful
             if self.result.success and self.result.path:
-                # Create final frame showing complete solution
-                fig = plt.figure(figsize=(18, 8))
-
-                # Left side: maze with complete solution path
-                ax1 = plt.subplot2grid((1, 2), (0, 0))
-
-                # Create a mock step_data for the final state
-                final_step_data = {
-                    'step': self.steps_data[-1]['step'] + 1 if self.steps_data else 1,
-                    'expanded_node': self.env.end,
-                    'neighbors_added': [],
-                    'frontier_before': [],
-                    'frontier_after': [],
-                    'frontier': [],
-                    'visited': self.result.visited,
-                    'current_path': self.result.path,
-                    'visited_count': len(self.result.visited),
-                    'frontier_size': 0
-                }
-
-                self._plot_maze(ax1, final_step_data)
-                ax1.set_title(f"{self.algorithm_name} Search - Final Solution")
-
-                # Right side: solution metrics
-                ax2 = plt.subplot2grid((1, 2), (0, 1))
-                ax2.axis('off')
-
-                # Create solution summary table
-                table_data = [
-                    ["Total Steps", str(self.result.steps)],
-                    ["Path Length", str(len(self.result.path))],
-                    ["Visited Nodes", str(len(self.result.visited))],
-                    ["Execution Time", f"{self.result.execution_time:.3f}s"],
-                    ["Efficiency", f"{len(self.result.path)/len(self.result.visited)*100:.1f}%"]
-                ]
-
-                solution_table = ax2.table(
-                    cellText=table_data,
-                    colLabels=["Metric", "Value"],
-                    colWidths=[0.3, 0.7],
-                    loc='center',
-                    cellLoc='center',
-                    bbox=[0.1, 0.4, 0.8, 0.5]
-                )
-                solution_table.auto_set_font_size(False)
-                solution_table.set_fontsize(12)
-
-                # Style table
-                for i in range(len(table_data) + 1):
-                    for j in range(2):
-                        cell = solution_table[i, j]
-                        cell.set_edgecolor('black')
-                        if i == 0:  # Header
-                            cell.set_facecolor('#4472C4')
-                            cell.set_text_props(color='white', fontweight='bold')
-                        else:
-                            cell.set_facecolor('#D9E1F2' if i % 2 else '#E9EDF4')
-
-                # Add completion message
-                ax2.text(0.5, 0.8, "SEARCH COMPLETED", ha='center', va='center',
-                        fontsize=18, fontweight='bold', color='green')
-                ax2.text(0.5, 0.2, f"Solution path found with {len(self.result.path)-1} steps",
-                        ha='center', va='center', fontsize=14)
-
-                plt.tight_layout()
-
-                frame_file = os.path.join(temp_dir, "frame_final.png")
-                plt.savefig(frame_file, dpi=dpi)
-                frame_files.append(frame_file)
-                plt.close(fig)
-
-            # Create GIF
-            with imageio.get_writer(filename, mode='I', fps=fps) as writer:
-                for frame_file in frame_files:
-                    image = imageio.imread(frame_file)
-                    writer.append_data(image)
-
-        print(f"GIF animation saved to {filename}")
+                yield self._create_solution_frame(dpi)
+
+        self._write_animation(frames(), filename, fps, format)
+
+        print(f"{format.upper()} animation saved to {filename}")
 
 
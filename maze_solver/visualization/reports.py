@@ -10,10 +10,15 @@ from ..algorithms.informed.greedy_best_first_search import GreedyBestFirstSearch
 from ..algorithms.informed.a_star_search import AStarSearch
 
 
-def compare_search_algorithms(maze_size=10, maze_id=None, show_visualizations=False):
-    """Compare performance of different search algorithms on the same maze."""
+def compare_search_algorithms(maze_size=10, maze_id=None, show_visualizations=False, show_exploration=True):
+    """Compare performance of different search algorithms on the same maze.
+
+    With show_exploration off, the searches record no exploration history (and
+    run compiled when Numba is installed), so the results stay small but cannot
+    drive step-by-step visualizations or dashboards.
+    """
     # Create a maze environment
-    config = Config(maze_size=maze_size, maze_id=maze_id, show_exploration=True)
+    config = Config(maze_size=maze_size, maze_id=maze_id, show_exploration=show_exploration)
     env = MazeEnvironment(config)
 
     # Create algorithm instances
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from maze_solver.core.config import Config
+from maze_solver.core.environment import MazeEnvironment
+
+
+@pytest.fixture
+def cyclic_env():
+    """Factory of environments over random open grids, which unlike generated mazes have cycles."""
+    def make(seed, show_exploration, size=9, env_class=MazeEnvironment, **config):
+        env = env_class(Config(maze_size=3, maze_id=1, show_exploration=show_exploration, **config))
+        rng = np.random.default_rng(seed)
+        grid = (rng.random((size, size)) < 0.25).astype(np.int8)
+        grid[0, :] = grid[-1, :] = grid[:, 0] = grid[:, -1] = 1
+        grid[1, 1] = grid[-2, -2] = 0
+        env.grid = grid
+        env.start = (1, 1)
+        env.end = (size - 2, size - 2)
+        env._create_graph()
+        return env
+    return make
@@ -0,0 +1,35 @@
+import gc
+import os
+import pickle
+
+from maze_solver.algorithms.uninformed.breadth_first_search import BreadthFirstSearch
+from maze_solver.core.config import Config
+from maze_solver.core.environment import MazeEnvironment
+
+
+def spooled_result(sink):
+    env = MazeEnvironment(Config(maze_size=5, maze_id=1, show_exploration=True, exploration_sink=str(sink)))
+    return BreadthFirstSearch(env).run()
+
+
+def test_spool_is_closed_when_search_returns(tmp_path):
+    history = spooled_result(tmp_path).exploration_history
+
+    assert history._writer is None
+    assert os.listdir(tmp_path) == [os.path.basename(history.path)]
+    assert len(list(history)) == len(history)
+
+
+def test_spool_is_deleted_with_its_history(tmp_path):
+    result = spooled_result(tmp_path)
+    copy = pickle.loads(pickle.dumps(result.exploration_history))
+    steps = len(list(result.exploration_history))
+
+    del copy
+    gc.collect()
+    assert len(os.listdir(tmp_path)) == 1
+    assert len(list(result.exploration_history)) == steps
+
+    del result
+    gc.collect()
+    assert os.listdir(tmp_path) == []
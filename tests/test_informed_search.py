@@ -0,0 +1,54 @@
+import pytest
+
+from maze_solver.algorithms.informed import a_star_search
+from maze_solver.algorithms.informed.a_star_search import AStarSearch
+from maze_solver.algorithms.informed.greedy_best_first_search import GreedyBestFirstSearch
+from maze_solver.core._numba import NUMBA_AVAILABLE
+from maze_solver.core.config import Config
+from maze_solver.core.environment import MazeEnvironment
+
+
+@pytest.mark.parametrize("algorithm, compiled", [
+    (GreedyBestFirstSearch, False),  # Greedy has no compiled kernel
+    (AStarSearch, False),
+    pytest.param(AStarSearch, True, marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="needs Numba")),
+])
+def test_fast_search_matches_traced_search_on_cyclic_grids(monkeypatch, cyclic_env, algorithm, compiled):
+    monkeypatch.setattr(a_star_search, "NUMBA_AVAILABLE", compiled)
+    for seed in range(100):
+        traced = algorithm(cyclic_env(seed, show_exploration=True)).run()
+        fast = algorithm(cyclic_env(seed, show_exploration=False)).run()
+
+        assert fast.success == traced.success
+        assert fast.path == traced.path
+        assert fast.steps == traced.steps
+        assert fast.visited == traced.visited
+        assert fast.node_discovery == traced.node_discovery
+        assert fast.node_expansion == traced.node_expansion
+
+
+class WeightedEnvironment(MazeEnvironment):
+    """Environment where entering the right half of the grid costs 3 per step."""
+
+    def get_step_cost(self, state1, state2):
+        return 3 if state2[1] > self.grid.shape[1] // 2 else 1
+
+
+def test_weighted_edges_away_from_start_skip_unit_cost_kernel(cyclic_env):
+    results = []
+    for show_exploration in (True, False):
+        env = cyclic_env(7, show_exploration, size=15, env_class=WeightedEnvironment)
+        results.append(AStarSearch(env).run())
+    traced, fast = results
+
+    assert not env.unit_step_costs and env.integer_step_costs
+    assert fast.path == traced.path
+    assert fast.node_expansion == traced.node_expansion
+
+
+def test_generated_weighted_environment_reports_its_step_costs():
+    env = WeightedEnvironment(Config(maze_size=5, maze_id=1, show_exploration=False))
+
+    assert not env.unit_step_costs
+    assert env.integer_step_costs
+    assert MazeEnvironment(Config(maze_size=5, maze_id=1, show_exploration=False)).unit_step_costs
@@ -0,0 +1,54 @@
+import dataclasses
+
+import pytest
+
+from maze_solver.algorithms.informed.a_star_search import AStarSearch
+from maze_solver.algorithms.uninformed.breadth_first_search import BreadthFirstSearch
+from maze_solver.core.config import Config
+from maze_solver.core.environment import MazeEnvironment
+from maze_solver.core.results import SearchResult
+
+
+def test_step_maps_are_public_fields():
+    result = SearchResult(node_discovery={(1, 1): 0}, node_expansion={(1, 1): 1})
+
+    assert result.node_discovery == {(1, 1): 0}
+    assert result.node_expansion == {(1, 1): 1}
+    assert "node_discovery={(1, 1): 0}" in repr(result)
+    assert dataclasses.asdict(result)["node_expansion"] == {(1, 1): 1}
+    assert result == SearchResult(node_discovery={(1, 1): 0}, node_expansion={(1, 1): 1})
+    assert result != SearchResult()
+
+
+def test_step_maps_default_to_empty_dicts():
+    result = SearchResult()
+    result.node_discovery[(1, 1)] = 0
+
+    assert result.node_discovery == {(1, 1): 0}
+    assert result.node_expansion == {}
+
+
+def kernel_and_traced_results(algorithm):
+    fast_env = MazeEnvironment(Config(maze_size=10, maze_id=1, show_exploration=False))
+    traced = algorithm(MazeEnvironment(Config(maze_size=10, maze_id=1, show_exploration=True))).run()
+    return algorithm(fast_env)._search_compiled(fast_env.start, fast_env.end), traced
+
+
+@pytest.mark.parametrize("algorithm", [BreadthFirstSearch, AStarSearch])
+def test_step_maps_built_from_kernel_arrays_match_traced_search(algorithm):
+    kernel, traced = kernel_and_traced_results(algorithm)
+
+    assert list(kernel.node_discovery.items()) == list(traced.node_discovery.items())
+    assert list(kernel.node_expansion.items()) == list(traced.node_expansion.items())
+    assert all(type(step) is int for step in kernel.node_discovery.values())
+
+
+def test_result_built_from_kernel_arrays_compares_and_prints_its_step_maps():
+    kernel, traced = kernel_and_traced_results(BreadthFirstSearch)
+    rebuilt = SearchResult(path=traced.path, visited=traced.visited, success=True, steps=traced.steps,
+                           node_discovery=traced.node_discovery, node_expansion=traced.node_expansion)
+
+    assert kernel == rebuilt
+    assert repr(kernel) == repr(rebuilt)
+    assert f"node_discovery={traced.node_discovery!r}" in repr(kernel)
+    assert kernel != dataclasses.replace(rebuilt, node_expansion={})
@@ -0,0 +1,68 @@
+import pytest
+
+from maze_solver.algorithms.uninformed import base as uninformed_base
+from maze_solver.algorithms.uninformed.bidirectional_breadth_first_search import BidirectionalBreadthFirstSearch
+from maze_solver.algorithms.uninformed.breadth_first_search import BreadthFirstSearch
+
+
+def assert_same_result(traced, fast):
+    assert fast.success == traced.success
+    assert fast.path == traced.path
+    assert fast.steps == traced.steps
+    assert fast.visited == traced.visited
+    assert fast.node_discovery == traced.node_discovery
+    assert fast.node_expansion == traced.node_expansion
+
+
+def test_bidirectional_path_is_as_short_as_bfs(cyclic_env):
+    for seed in range(200):
+        bfs = BreadthFirstSearch(cyclic_env(seed, show_exploration=False)).run()
+        bidirectional = BidirectionalBreadthFirstSearch(cyclic_env(seed, show_exploration=False)).run()
+
+        assert bidirectional.success == bfs.success
+        if bfs.success:
+            assert len(bidirectional.path) == len(bfs.path)
+            assert bidirectional.path[0] == bfs.path[0] and bidirectional.path[-1] == bfs.path[-1]
+
+
+def test_bidirectional_traced_search_matches_headless_search(cyclic_env):
+    for seed in range(100):
+        traced = BidirectionalBreadthFirstSearch(cyclic_env(seed, show_exploration=True)).run()
+        fast = BidirectionalBreadthFirstSearch(cyclic_env(seed, show_exploration=False)).run()
+
+        assert_same_result(traced, fast)
+        assert len(traced.exploration_history) == traced.steps
+
+
+@pytest.mark.parametrize("show_exploration", [True, False])
+def test_bidirectional_start_is_goal(cyclic_env, show_exploration):
+    env = cyclic_env(0, show_exploration)
+    result = BidirectionalBreadthFirstSearch(env).run(env.start, env.start)
+
+    assert result.success
+    assert result.path == [env.start]
+    assert result.steps == 1
+
+
+def test_bidirectional_stops_at_max_steps_within_a_layer(cyclic_env):
+    for seed in range(20):
+        bfs = BreadthFirstSearch(cyclic_env(seed, show_exploration=False)).run()
+        full = BidirectionalBreadthFirstSearch(cyclic_env(seed, show_exploration=False)).run()
+        for max_steps in range(1, full.steps):
+            traced = BidirectionalBreadthFirstSearch(
+                cyclic_env(seed, show_exploration=True, max_steps=max_steps)).run()
+            fast = BidirectionalBreadthFirstSearch(
+                cyclic_env(seed, show_exploration=False, max_steps=max_steps)).run()
+
+            assert_same_result(traced, fast)
+            assert fast.steps == max_steps
+            if fast.success:
+                assert len(fast.path) == len(bfs.path)
+
+
+def test_bidirectional_does_not_compile_the_traversal_kernel(monkeypatch, cyclic_env):
+    monkeypatch.setattr(uninformed_base, "warmup", lambda: pytest.fail("compiled the traversal kernel"))
+
+    search = BidirectionalBreadthFirstSearch(cyclic_env(0, show_exploration=False))
+
+    assert not search.compiled